@@ -0,0 +1,41 @@
+from typing import Optional
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from backend.app.schemas.schemas import ProfilerUpdate
+from backend.app.core.dependencies import get_current_admin
+from backend.app.core.profiler import profiler
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(get_current_admin)],
+)
+
+
+# =====================================================
+# REQUEST PROFILER
+# =====================================================
+# Settings apply to this worker process only; with several uvicorn
+# workers, toggle each one (or set PROFILER_* and restart).
+@router.get("/profiler")
+async def profiler_status():
+    return profiler.status()
+
+
+@router.post("/profiler")
+async def update_profiler(data: ProfilerUpdate):
+    if data.reset:
+        profiler.reset()
+    profiler.configure(
+        enabled=data.enabled,
+        sample_rate=data.sample_rate,
+        interval_ms=data.interval_ms,
+    )
+    return profiler.status()
+
+
+@router.get("/profiler/stacks")
+async def profiler_stacks(route: Optional[str] = None):
+    """Collapsed stacks for flamegraph.pl / speedscope"""
+    return PlainTextResponse(profiler.collapsed(route))
@@ -1,14 +1,26 @@
-from fastapi import APIRouter, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from datetime import datetime
-import os
 
-from backend.app.schemas.schemas import SignupSchema, LoginSchema
-from database.connection import users_collection
+from backend.app.schemas.schemas import (
+    SignupSchema,
+    LoginSchema,
+    ForgotPasswordSchema,
+    ResetPasswordSchema,
+)
+from database.connection import Database
+from backend.app.core.config import get_settings
+from backend.app.core.dependencies import get_db
 from backend.app.core.jwt_utils import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token
 )
+from backend.app.services.email_service import (
+    generate_password_reset_token,
+    verify_password_reset_token,
+    reset_token_matches,
+    send_password_reset_email,
+)
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -17,9 +29,11 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 # SIGNUP
 # =====================================================
 @router.post("/signup")
-async def signup(data: SignupSchema, response: Response):
+async def signup(
+    data: SignupSchema, response: Response, db: Database = Depends(get_db)
+):
     # Check if user already exists
-    existing_user = await users_collection.find_one({"email": data.email})
+    existing_user = await db.users.get_by_email(data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -27,7 +41,7 @@ async def signup(data: SignupSchema, response: Response):
         )
 
     # Hash password
-    hashed_password = hash_password(data.password)
+    hashed_password = await hash_password_async(data.password)
 
     # Create user
     user_doc = {
@@ -35,20 +49,22 @@ async def signup(data: SignupSchema, response: Response):
         "email": data.email,
         "password_hash": hashed_password,
         "created_at": datetime.utcnow(),
+        "completed_count": 0,
     }
 
-    result = await users_collection.insert_one(user_doc)
+    user_id = await db.users.create(user_doc)
 
     # Create JWT
     access_token = create_access_token(
         data={
-            "id": str(result.inserted_id),
-            "email": data.email
+            "id": user_id,
+            "email": data.email,
+            "name": data.name
         }
     )
 
     # 🔥 SET COOKIE (AUTO LOGIN AFTER SIGNUP)
-    is_prod = os.getenv("RENDER") is not None
+    is_prod = get_settings().IS_PROD
     response.set_cookie(
         key="access_token",
         value=access_token,
@@ -62,7 +78,7 @@ async def signup(data: SignupSchema, response: Response):
         "message": "User created successfully",
         "access_token": access_token, # Added to JSON for frontend
         "user": {
-            "id": str(result.inserted_id),
+            "id": user_id,
             "name": data.name,
             "email": data.email,
         }
@@ -73,16 +89,17 @@ async def signup(data: SignupSchema, response: Response):
 # LOGIN
 # =====================================================
 @router.post("/login")
-async def login(data: LoginSchema, response: Response):
-    print(f"DEBUG: Login attempt for email: {data.email}")
-    user = await users_collection.find_one({"email": data.email})
+async def login(
+    data: LoginSchema, response: Response, db: Database = Depends(get_db)
+):
+    user = await db.users.get_by_email(data.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
-    if not verify_password(data.password, user["password_hash"]):
+    if not await verify_password_async(data.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -92,12 +109,13 @@ async def login(data: LoginSchema, response: Response):
     access_token = create_access_token(
         data={
             "id": str(user["_id"]),
-            "email": user["email"]
+            "email": user["email"],
+            "name": user.get("name")
         }
     )
 
     # 🔥 SET COOKIE (THIS FIXES EVERYTHING)
-    is_prod = os.getenv("RENDER") is not None
+    is_prod = get_settings().IS_PROD
     response.set_cookie(
         key="access_token",
         value=access_token,
@@ -114,6 +132,7 @@ async def login(data: LoginSchema, response: Response):
             "id": str(user["_id"]),
             "name": user["name"],
             "email": user["email"],
+            "completed_count": user.get("completed_count", 0),
         }
     }
 
@@ -131,13 +150,53 @@ async def logout(response: Response):
     return {"success": True, "message": "Logged out successfully"}
 
 
+# =====================================================
+# PASSWORD RESET
+# =====================================================
+@router.post("/forgot-password")
+async def forgot_password(data: ForgotPasswordSchema, db: Database = Depends(get_db)):
+    # Same answer whether or not the account exists; the email is queued,
+    # so the response never waits on SMTP
+    user = await db.users.get_by_email(data.email)
+    if user:
+        token = generate_password_reset_token(user["email"], user["password_hash"])
+        send_password_reset_email(user["email"], token)
+
+    return {
+        "success": True,
+        "message": "If an account exists for this email, a reset link has been sent"
+    }
+
+
+@router.post("/reset-password")
+async def reset_password(data: ResetPasswordSchema, db: Database = Depends(get_db)):
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid or expired reset token"
+    )
+    payload = verify_password_reset_token(data.token)
+    if payload is None:
+        raise invalid
+
+    user = await db.users.get_by_email(payload["email"])
+    if not user or not reset_token_matches(payload, user["password_hash"]):
+        raise invalid
+
+    # Only replaces the hash the token was issued for, so it works once
+    new_hash = await hash_password_async(data.password)
+    if not await db.users.replace_password_hash(str(user["_id"]), user["password_hash"], new_hash):
+        raise invalid
+
+    return {"success": True, "message": "Password has been reset"}
+
+
 # =====================================================
 # DEBUG (OPTIONAL – REMOVE IN PROD)
 # =====================================================
 @router.get("/debug/users")
-async def debug_users():
+async def debug_users(db: Database = Depends(get_db)):
     users = []
-    async for user in users_collection.find({}):
+    for user in await db.users.list_all():
         users.append({
             "email": user["email"],
             "id": str(user["_id"])
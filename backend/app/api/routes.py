@@ -1,11 +1,11 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 from typing import Optional, List
-from datetime import datetime
 
 from database.models import ProjectCreate, ProjectStatusUpdate, Project
-from backend.app.services.services import ProjectService
-from database.connection import project_completions
+from backend.app.services.services import ProjectService, CompletionService
 from backend.app.core.dependencies import get_current_user, get_current_user_optional
+from backend.app.core.pagination import InvalidCursor
+from backend.app.services.project_query import ProjectQuery, project_query_params
 
 router = APIRouter(tags=["projects"])
 
@@ -35,19 +35,8 @@ async def complete_project(
     project_id: str,
     current_user: dict = Depends(get_current_user)
 ):
-    existing = await project_completions.find_one({
-        "user_id": current_user["id"],
-        "project_id": project_id
-    })
-
-    if existing:
-        return {"completed": True}
-
-    await project_completions.insert_one({
-        "user_id": current_user["id"],
-        "project_id": project_id,
-        "completed_at": datetime.utcnow()
-    })
+    if await CompletionService.mark_completed(current_user["id"], project_id) == "not_found":
+        raise HTTPException(status_code=404, detail="Project not found")
 
     return {"completed": True}
 
@@ -57,32 +46,45 @@ async def complete_project(
 # --------------------------------------------------
 @router.get("/projects", response_model=List[Project])
 async def get_projects(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    filters: ProjectQuery = Depends(project_query_params),
     current_user: dict | None = Depends(get_current_user_optional)
 ):
     try:
-        projects = await ProjectService.get_all_projects(
-            skip=skip,
-            limit=limit,
-            status=status
-        )
-
-        # Add user-specific completion status
-        if current_user:
-            for project in projects:
-                found = await project_completions.find_one({
-                    "user_id": current_user["id"],
-                    "project_id": project["id"]
-                })
-                project["isCompleted"] = bool(found)
+        # Offset paging is kept for old clients; keyset paging costs the
+        # same for every page and is used whenever no offset is given
+        if skip:
+            projects = await ProjectService.get_all_projects(
+                skip=skip,
+                limit=limit,
+                filters=filters
+            )
         else:
-            for project in projects:
-                project["isCompleted"] = False
+            projects, next_cursor = await ProjectService.get_projects_page(
+                limit=limit,
+                cursor=cursor,
+                filters=filters
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+
+        # Add user-specific completion status (one $in query per page)
+        completed_ids = set()
+        if current_user and projects:
+            completed_ids = await CompletionService.get_completed_project_ids(
+                current_user["id"],
+                [project["id"] for project in projects]
+            )
+        for project in projects:
+            project["isCompleted"] = project["id"] in completed_ids
 
         return projects
 
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,7 +1,155 @@
 from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Optional
 import os
 
-load_dotenv()
 
-SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
-ALGORITHM = "HS256"
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip()
+
+
+def _int_env(name: str, default: Optional[int] = None) -> Optional[int]:
+    value = _env(name)
+    return int(value) if value is not None else default
+
+
+def _bool_env(name: str, default: bool = False) -> bool:
+    value = _env(name)
+    return value.lower() == "true" if value is not None else default
+
+
+class Settings:
+    """Application settings, read from the environment (and .env) once"""
+
+    def __init__(self):
+        self.SECRET_KEY = _env("SECRET_KEY", "dev-secret")
+        self.ALGORITHM = "HS256"
+
+        # Set by Render; enables secure cross-site cookies
+        self.IS_PROD = os.getenv("RENDER") is not None
+
+        # Storage: "mongo", or "memory" for benchmarks and offline runs
+        self.STORAGE_BACKEND = _env("STORAGE_BACKEND", "mongo").lower()
+
+        # MongoDB connection
+        self.MONGODB_URL = _env("MONGODB_URL", "")
+        self.DATABASE_NAME = _env("DATABASE_NAME", "")
+
+        # Connection pool tuning; None keeps the driver default
+        self.MONGO_POOL_OPTIONS = {
+            k: v for k, v in {
+                "maxPoolSize": _int_env("MONGO_MAX_POOL_SIZE"),
+                "minPoolSize": _int_env("MONGO_MIN_POOL_SIZE"),
+                "maxIdleTimeMS": _int_env("MONGO_MAX_IDLE_TIME_MS"),
+                "waitQueueTimeoutMS": _int_env("MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+                "connectTimeoutMS": _int_env("MONGO_CONNECT_TIMEOUT_MS"),
+                "serverSelectionTimeoutMS": _int_env("MONGO_SERVER_SELECTION_TIMEOUT_MS"),
+                "compressors": _env("MONGO_COMPRESSORS"),
+                "readPreference": _env("MONGO_READ_PREFERENCE"),
+            }.items() if v is not None
+        }
+
+        # Connections opened on startup so the first requests skip the handshake
+        self.MONGO_WARMUP_CONNECTIONS = _int_env(
+            "MONGO_WARMUP_CONNECTIONS",
+            self.MONGO_POOL_OPTIONS.get("minPoolSize", 1),
+        )
+
+        # Drop indexes that are not in the registry (off by default)
+        self.INDEX_DROP_EXTRA = _bool_env("INDEX_DROP_EXTRA")
+
+        # Authenticated-user cache
+        self.USER_CACHE_TTL_SECONDS = float(_env("USER_CACHE_TTL_SECONDS", "300"))
+        self.USER_CACHE_MAX_SIZE = _int_env("USER_CACHE_MAX_SIZE", 10000)
+
+        # Build the current user from the signed token claims without a DB lookup
+        self.TRUST_TOKEN_CLAIMS = _bool_env("TRUST_TOKEN_CLAIMS")
+
+        # Verified JWT payloads, kept until each token expires
+        self.TOKEN_CACHE_MAX_SIZE = _int_env("TOKEN_CACHE_MAX_SIZE", 10000)
+
+        # bcrypt cost factor and the worker pool that runs it off the event loop
+        self.BCRYPT_ROUNDS = _int_env("BCRYPT_ROUNDS", 12)
+        self.BCRYPT_POOL_SIZE = _int_env("BCRYPT_POOL_SIZE", min(4, os.cpu_count() or 1))
+
+        # Largest batch accepted by the bulk create / complete endpoints
+        self.BULK_MAX_ITEMS = _int_env("BULK_MAX_ITEMS", 1000)
+
+        # Background task queue for deferred writes (cascades, counters)
+        self.TASK_CONCURRENCY = _int_env("TASK_CONCURRENCY", 4)
+        self.TASK_MAX_RETRIES = _int_env("TASK_MAX_RETRIES", 3)
+        self.TASK_RETRY_DELAY_SECONDS = float(_env("TASK_RETRY_DELAY_SECONDS", "0.5"))
+        self.TASK_DRAIN_TIMEOUT_SECONDS = float(_env("TASK_DRAIN_TIMEOUT_SECONDS", "30"))
+
+        # Per-user completed project sets used to render isCompleted. Each
+        # worker only sees its own writes, so with several workers or
+        # instances a completion made elsewhere shows up after at most the
+        # TTL; raise it only for single-process deployments
+        self.COMPLETION_CACHE_TTL_SECONDS = float(_env("COMPLETION_CACHE_TTL_SECONDS", "5"))
+        self.COMPLETION_CACHE_MAX_SIZE = _int_env("COMPLETION_CACHE_MAX_SIZE", 10000)
+
+        # Anonymous project responses served with ETag / 304 support
+        self.RESPONSE_CACHE_TTL_SECONDS = float(_env("RESPONSE_CACHE_TTL_SECONDS", "30"))
+        self.RESPONSE_CACHE_MAX_SIZE = _int_env("RESPONSE_CACHE_MAX_SIZE", 256)
+
+        # Length of description previews in view=summary listings
+        self.DESCRIPTION_PREVIEW_LENGTH = _int_env("DESCRIPTION_PREVIEW_LENGTH", 200)
+
+        # Requests issuing more database commands than this are flagged as
+        # possible N+1 queries on /metrics and in the log (0 disables)
+        self.METRICS_QUERY_THRESHOLD = _int_env("METRICS_QUERY_THRESHOLD", 10)
+
+        # Request sampling profiler, toggled at runtime from /admin/profiler
+        self.PROFILER_ENABLED = _bool_env("PROFILER_ENABLED")
+        self.PROFILER_SAMPLE_RATE = float(_env("PROFILER_SAMPLE_RATE", "0.05"))
+        self.PROFILER_INTERVAL_MS = float(_env("PROFILER_INTERVAL_MS", "10"))
+
+        # Users allowed to call the /admin endpoints, by user id (comma
+        # separated). Ids cannot be claimed by signing up, unlike emails
+        self.ADMIN_USER_IDS = {
+            user_id.strip()
+            for user_id in _env("ADMIN_USER_IDS", "").split(",")
+            if user_id.strip()
+        }
+
+        # Outgoing email; with no SMTP_SERVER messages are dropped with a warning
+        self.SMTP_SERVER = _env("SMTP_SERVER", "")
+        self.SMTP_PORT = _int_env("SMTP_PORT", 587)
+        self.SMTP_USER = _env("SMTP_USER", "")
+        self.SMTP_PASSWORD = _env("SMTP_PASSWORD", "")
+        self.SMTP_STARTTLS = _bool_env("SMTP_STARTTLS", True)
+        self.SMTP_TIMEOUT_SECONDS = float(_env("SMTP_TIMEOUT_SECONDS", "10"))
+        self.SENDER_EMAIL = _env("SENDER_EMAIL", "noreply@freelance-marketplace.com")
+        self.FRONTEND_URL = _env("FRONTEND_URL", "http://localhost:5174").rstrip("/")
+        self.PASSWORD_RESET_EXPIRE_HOURS = _int_env("PASSWORD_RESET_EXPIRE_HOURS", 24)
+
+        # Email delivery: persistent SMTP connections, and how many queued
+        # messages are sent per connection checkout
+        self.EMAIL_POOL_SIZE = _int_env("EMAIL_POOL_SIZE", 2)
+        self.EMAIL_BATCH_SIZE = _int_env("EMAIL_BATCH_SIZE", 50)
+        self.EMAIL_BATCH_WAIT_MS = float(_env("EMAIL_BATCH_WAIT_MS", "50"))
+        self.EMAIL_QUEUE_MAX_SIZE = _int_env("EMAIL_QUEUE_MAX_SIZE", 10000)
+
+        # Real-time project feed (/projects/stream): "auto" follows a Mongo
+        # change stream when the deployment has one (replica set), else
+        # "local" publishes from this process's write handlers. The stream
+        # is opened in the background, with in-process publishing until it
+        # is up; "change_stream" keeps retrying instead of falling back
+        self.PROJECT_FEED_SOURCE = _env("PROJECT_FEED_SOURCE", "auto").lower()
+        self.PROJECT_FEED_QUEUE_SIZE = _int_env("PROJECT_FEED_QUEUE_SIZE", 256)
+        self.PROJECT_FEED_REPLAY_SIZE = _int_env("PROJECT_FEED_REPLAY_SIZE", 1000)
+        self.PROJECT_FEED_HEARTBEAT_SECONDS = float(_env("PROJECT_FEED_HEARTBEAT_SECONDS", "15"))
+
+        # Project search: "auto" tries Mongo $text first, "memory" forces the
+        # in-process inverted index, "mongo" never falls back
+        self.SEARCH_BACKEND = _env("SEARCH_BACKEND", "auto").lower()
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Load .env and build the settings on first use"""
+    load_dotenv()
+    return Settings()
@@ -1,9 +1,68 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
-from jose import JWTError, jwt
-from bson import ObjectId
-from database.connection import users_collection
-from backend.app.core.config import SECRET_KEY, ALGORITHM
+from jose import JWTError
+from bson.errors import InvalidId
+from database.connection import Database, get_database
+from backend.app.core.cache import TTLCache
+from backend.app.core.jwt_utils import decode_token
+from backend.app.core.config import get_settings
+
+settings = get_settings()
+
+# Resolved user identities keyed by user id
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+def get_db() -> Database:
+    """Database dependency; override it to run the app on another backend"""
+    return get_database()
+
+
+def invalidate_user(user_id: str):
+    """Drop a cached user; call whenever a user record changes"""
+    user_cache.pop(user_id)
+
+
+def clear_user_cache():
+    user_cache.clear()
+
+
+def user_cache_stats() -> dict:
+    return user_cache.stats()
+
+
+async def resolve_user(payload: dict, db: Database) -> Optional[dict]:
+    """Resolve token claims to a user, using the cache before the database"""
+    user_id = payload.get("id")
+    if not user_id:
+        return None
+
+    if settings.TRUST_TOKEN_CLAIMS and payload.get("email"):
+        return {
+            "id": user_id,
+            "email": payload["email"],
+            "name": payload.get("name"),
+        }
+
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = await db.users.get(user_id)
+    if not user:
+        return None
+
+    current_user = {
+        "id": str(user["_id"]),
+        "email": user["email"],
+        "name": user.get("name"),
+    }
+    user_cache.set(user_id, current_user)
+    return current_user
+
 
 # Function to get token from cookie or header
 async def get_token(request: Request):
@@ -19,7 +78,7 @@ async def get_token(request: Request):
     
     return None
 
-async def get_current_user(request: Request):
+async def get_current_user(request: Request, db: Database = Depends(get_db)):
     """Get current user (required authentication)"""
     token = await get_token(request)
     
@@ -36,44 +95,43 @@ async def get_current_user(request: Request):
         )
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         user_id: str = payload.get("id")
         if not user_id:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = await users_collection.find_one({"_id": ObjectId(user_id)})
+    try:
+        user = await resolve_user(payload, db)
+    except (InvalidId, TypeError):
+        raise credentials_exception
     if not user:
         raise credentials_exception
 
-    return {
-        "id": str(user["_id"]),
-        "email": user["email"],
-        "name": user.get("name"),
-    }
+    return user
 
 
-async def get_current_user_optional(request: Request):
+async def get_current_user_optional(
+    request: Request, db: Database = Depends(get_db)
+):
     """Get current user if token provided, otherwise return None"""
     token = await get_token(request)
     if not token:
         return None
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("id")
-        if not user_id:
-            return None
-        
-        user = await users_collection.find_one({"_id": ObjectId(user_id)})
-        if not user:
-            return None
-        
-        return {
-            "id": str(user["_id"]),
-            "email": user["email"],
-            "name": user.get("name"),
-        }
-    except (JWTError, ValueError, TypeError):
+        payload = decode_token(token)
+        return await resolve_user(payload, db)
+    except (JWTError, InvalidId, ValueError, TypeError):
         return None
+
+
+async def get_current_admin(current_user=Depends(get_current_user)):
+    """Get current user, who must be listed in ADMIN_USER_IDS"""
+    if current_user["id"] not in settings.ADMIN_USER_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return current_user
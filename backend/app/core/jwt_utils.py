@@ -1,17 +1,42 @@
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from jose import JWTError, jwt
+import asyncio
 import bcrypt
+import hashlib
+import time
 from typing import Optional
-from backend.app.core.config import SECRET_KEY, ALGORITHM
+from backend.app.core.cache import TTLCache
+from backend.app.core.config import get_settings
+
+settings = get_settings()
 
 # JWT Configuration
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Decoded payloads keyed by token digest; each entry lives until token exp
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+
+# bcrypt releases the GIL, so a small thread pool keeps it off the event
+# loop; the semaphore makes extra callers wait instead of piling up work.
+# Both are created on first use: a semaphore binds to the loop that first
+# waits on it, so it is rebuilt for each new loop (tests, benchmark runs).
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+_bcrypt_slots: Optional[asyncio.Semaphore] = None
+_bcrypt_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+bcrypt_stats = {
+    "queued": 0,
+    "running": 0,
+    "calls": 0,
+    "total_seconds": 0.0,
+    "max_seconds": 0.0,
+}
+
 
 def hash_password(password: str) -> str:
     # bcrypt max 72 bytes safety
     safe_password = password.encode("utf-8")[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(safe_password, salt)
     return hashed.decode("utf-8")
 
@@ -23,6 +48,66 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def _get_bcrypt_executor() -> ThreadPoolExecutor:
+    global _bcrypt_executor
+    if _bcrypt_executor is None:
+        _bcrypt_executor = ThreadPoolExecutor(
+            max_workers=settings.BCRYPT_POOL_SIZE,
+            thread_name_prefix="bcrypt",
+        )
+    return _bcrypt_executor
+
+
+def _get_bcrypt_slots() -> asyncio.Semaphore:
+    global _bcrypt_slots, _bcrypt_slots_loop
+    loop = asyncio.get_running_loop()
+    if _bcrypt_slots is None or _bcrypt_slots_loop is not loop:
+        _bcrypt_slots = asyncio.Semaphore(settings.BCRYPT_POOL_SIZE)
+        _bcrypt_slots_loop = loop
+    return _bcrypt_slots
+
+
+async def _run_bcrypt(func, *args):
+    """Run a bcrypt call in the worker pool, waiting for a free slot"""
+    slots = _get_bcrypt_slots()
+    bcrypt_stats["queued"] += 1
+    try:
+        await slots.acquire()
+    finally:
+        bcrypt_stats["queued"] -= 1
+
+    bcrypt_stats["running"] += 1
+    started = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_bcrypt_executor(), func, *args)
+    finally:
+        elapsed = time.perf_counter() - started
+        bcrypt_stats["running"] -= 1
+        bcrypt_stats["calls"] += 1
+        bcrypt_stats["total_seconds"] += elapsed
+        bcrypt_stats["max_seconds"] = max(bcrypt_stats["max_seconds"], elapsed)
+        slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password without blocking the event loop"""
+    return await _run_bcrypt(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password without blocking the event loop"""
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_pool():
+    global _bcrypt_executor, _bcrypt_slots, _bcrypt_slots_loop
+    if _bcrypt_executor is not None:
+        _bcrypt_executor.shutdown(wait=False, cancel_futures=True)
+        _bcrypt_executor = None
+    _bcrypt_slots = _bcrypt_slots_loop = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -35,14 +120,35 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def decode_token(token: str) -> dict:
+    """Decode a JWT, reusing the payload of an already verified token.
+
+    Raises JWTError for invalid tokens; those are never cached.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = float(exp) - time.time()
+        if remaining > 0:
+            token_cache.set(key, payload, ttl=remaining)
+
+    return payload
+
+
 def verify_token(token: str) -> Optional[dict]:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         return payload
     except JWTError:
         return None
\ No newline at end of file
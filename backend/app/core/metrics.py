@@ -0,0 +1,188 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+from backend.app.core.config import get_settings
+from database.command_metrics import QueryStats, command_metrics, current_query_stats
+from database.pool_metrics import pool_metrics
+from backend.app.core.tasks import task_queue
+
+logger = logging.getLogger(__name__)
+
+# Request latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteStats:
+    __slots__ = ("buckets", "count", "seconds", "queries", "query_seconds", "max_queries", "flagged")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.max_queries = 0
+        self.flagged = 0
+
+
+class RequestMetrics:
+    """Latency and database usage per route template.
+
+    Only touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, query_threshold: int):
+        self.query_threshold = query_threshold
+        self.reset()
+
+    def reset(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = defaultdict(RouteStats)
+        self.statuses: Dict[Tuple[str, str, int], int] = defaultdict(int)
+
+    def observe(self, method: str, route: str, status: int, seconds: float, queries: QueryStats):
+        stats = self.routes[(method, route)]
+        stats.count += 1
+        stats.seconds += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                stats.buckets[i] += 1
+                break
+
+        stats.queries += queries.count
+        stats.query_seconds += queries.seconds
+        stats.max_queries = max(stats.max_queries, queries.count)
+        self.statuses[(method, route, status)] += 1
+
+        # Query counts growing with the result size usually mean N+1 lookups
+        if self.query_threshold and queries.count > self.query_threshold:
+            stats.flagged += 1
+            logger.warning(
+                "%s %s issued %d database queries (threshold %d); possible N+1",
+                method, route, queries.count, self.query_threshold,
+            )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def render_prometheus(metrics: RequestMetrics, gauges: Optional[Dict[str, dict]] = None) -> str:
+    """Render request, Mongo command, pool and task queue metrics in the Prometheus text format.
+
+    ``gauges`` maps extra metric names to stats dicts, one sample per key.
+    """
+    lines = [
+        "# HELP http_requests_total Requests by route template and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, status), count in sorted(metrics.statuses.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds Request latency by route template.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), s in sorted(metrics.routes.items()):
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, s.buckets):
+            cumulative += count
+            lines.append(
+                f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} {cumulative}"
+            )
+        labels = _labels(method=method, route=route)
+        lines.append(f'http_request_duration_seconds_bucket{_labels(method=method, route=route, le="+Inf")} {s.count}')
+        lines.append(f"http_request_duration_seconds_sum{labels} {s.seconds}")
+        lines.append(f"http_request_duration_seconds_count{labels} {s.count}")
+
+    per_route = (
+        ("http_request_db_queries_total", "counter", "Database commands issued by requests to a route.", "queries"),
+        ("http_request_db_seconds_total", "counter", "Database time spent by requests to a route.", "query_seconds"),
+        ("http_request_db_queries_max", "gauge", "Most database commands issued by one request to a route.", "max_queries"),
+        ("http_request_n_plus_one_total", "counter", "Requests above the per-request query threshold.", "flagged"),
+    )
+    for name, kind, help_text, attr in per_route:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for (method, route), s in sorted(metrics.routes.items()):
+            lines.append(f"{name}{_labels(method=method, route=route)} {getattr(s, attr)}")
+
+    commands = command_metrics.snapshot()
+    for name, help_text, key in (
+        ("mongo_commands_total", "MongoDB commands by name.", "count"),
+        ("mongo_command_failures_total", "Failed MongoDB commands by name.", "failures"),
+        ("mongo_command_seconds_total", "Time spent in MongoDB commands by name.", "seconds"),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for command, stats in sorted(commands.items()):
+            lines.append(f"{name}{_labels(command=command)} {stats[key]}")
+
+    lines += ["# HELP mongo_pool Connection pool state.", "# TYPE mongo_pool gauge"]
+    for key, value in pool_metrics.snapshot().items():
+        lines.append(f"mongo_pool{_labels(stat=key)} {value}")
+
+    gauges = {"task_queue": task_queue.stats(), **(gauges or {})}
+    for name, stats in gauges.items():
+        lines += [f"# TYPE {name} gauge"]
+        for key, value in stats.items():
+            lines.append(f"{name}{_labels(stat=key)} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each request and counting its Mongo commands.
+
+    Adds a Server-Timing header with the app and database time so the
+    numbers show up in the browser's network panel.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = QueryStats()
+        token = current_query_stats.set(queries)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'app;dur={elapsed:.1f}, '
+                    f'db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - started,
+                queries,
+            )
+
+
+request_metrics = RequestMetrics(get_settings().METRICS_QUERY_THRESHOLD)
@@ -0,0 +1,88 @@
+import base64
+from typing import Any, List, Optional, Tuple
+
+from bson import ObjectId, json_util
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(value: Any, doc_id: ObjectId, sort_field: str = "created_at") -> str:
+    """Encode the sort key of the last document on a page as an opaque token"""
+    raw = json_util.dumps([sort_field, value, doc_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_field: str = "created_at") -> Tuple[Any, ObjectId]:
+    """Decode a token produced by encode_cursor back into its sort key.
+
+    A cursor is only valid for the sort field it was issued for.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        field, value, doc_id = json_util.loads(raw)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+    if field != sort_field or not isinstance(doc_id, ObjectId):
+        raise InvalidCursor("Invalid pagination cursor")
+    return value, doc_id
+
+
+def keyset_filter(
+    cursor: Optional[str], sort_field: str = "created_at", direction: int = -1
+) -> dict:
+    """Build the filter selecting documents strictly after the cursor.
+
+    Pages are ordered by ``(sort_field, _id)`` so ties on the sort value
+    still have a stable position. Backed by a compound index on the same
+    keys, every page is a single index range scan regardless of depth.
+    """
+    if not cursor:
+        return {}
+
+    value, doc_id = decode_cursor(cursor, sort_field)
+    op = "$lt" if direction < 0 else "$gt"
+    return {
+        "$or": [
+            {sort_field: {op: value}},
+            {sort_field: value, "_id": {op: doc_id}},
+        ]
+    }
+
+
+async def fetch_keyset_page(
+    collection,
+    query: dict,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort_field: str = "created_at",
+    direction: int = -1,
+    projection: Optional[dict] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """Fetch one page of documents and the cursor for the next page"""
+    after = keyset_filter(cursor, sort_field, direction)
+    if query and after:
+        page_query = {"$and": [query, after]}
+    else:
+        page_query = query or after
+
+    docs = await (
+        collection.find(page_query, projection)
+        .sort([(sort_field, direction), ("_id", direction)])
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        last = docs[-1]
+        next_cursor = encode_cursor(last.get(sort_field), last["_id"], sort_field)
+
+    return docs, next_cursor
@@ -0,0 +1,247 @@
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Optional
+
+from backend.app.core.config import get_settings
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _Request:
+    """A sampled request in flight and the stacks taken before its route matched"""
+
+    __slots__ = ("task", "scope", "thread_id", "stacks")
+
+    def __init__(self, task: asyncio.Task, scope: dict):
+        self.task = task
+        self.scope = scope
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+
+
+def _route(scope: dict) -> Optional[str]:
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+def _is_event_stream(message: dict) -> bool:
+    return any(
+        name.lower() == b"content-type" and value.startswith(b"text/event-stream")
+        for name, value in message.get("headers", ())
+    )
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Wall-clock sampling profiler for a fraction of requests.
+
+    A daemon thread wakes every interval while sampled requests are in
+    flight and records each one's stack: the frames running on the event
+    loop when the request is on the CPU, or its coroutine await chain
+    ending in "<waiting>" while it waits on Mongo, bcrypt or a worker
+    thread ("<queued>" when it is ready but another task holds the loop).
+    Unsampled requests only pay for one random() call.
+
+    Stacks are added to their route template's totals as they are taken,
+    so long requests show up while still running, and are exported in
+    the collapsed format used by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 0.05, interval_ms: float = 10):
+        self._lock = threading.Lock()
+        self._inflight: Dict[int, _Request] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stacks: Dict[str, Counter] = defaultdict(Counter)
+        self.sampled_requests = 0
+        self.samples = 0
+        self.configure(enabled, sample_rate, interval_ms)
+
+    # Control
+    def configure(self, enabled: Optional[bool] = None, sample_rate: Optional[float] = None,
+                  interval_ms: Optional[float] = None):
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if interval_ms is not None:
+            self.interval = max(interval_ms, 1) / 1000
+        if enabled is not None:
+            self.enabled = enabled
+            if enabled and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def reset(self):
+        with self._lock:
+            self.stacks = defaultdict(Counter)
+            self.sampled_requests = 0
+            self.samples = 0
+
+    def status(self) -> dict:
+        with self._lock:
+            routes = {
+                route: sum(stacks.values()) for route, stacks in self.stacks.items()
+            }
+            return {
+                "enabled": self.enabled,
+                "sample_rate": self.sample_rate,
+                "interval_ms": self.interval * 1000,
+                "sampled_requests": self.sampled_requests,
+                "samples": self.samples,
+                "in_flight": len(self._inflight),
+                "routes": routes,
+            }
+
+    def collapsed(self, route: Optional[str] = None) -> str:
+        """Samples as "route;frame;frame count" lines, optionally for one route"""
+        with self._lock:
+            lines = [
+                f"{name};{stack} {count}"
+                for name, stacks in sorted(self.stacks.items())
+                if route is None or name == route
+                for stack, count in stacks.most_common()
+            ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    # Request lifecycle, called from the event loop
+    def should_sample(self) -> bool:
+        return self.enabled and random.random() < self.sample_rate
+
+    def begin(self, scope: dict) -> Optional[_Request]:
+        task = asyncio.current_task()
+        if task is None:
+            return None
+        request = _Request(task, scope)
+        with self._lock:
+            self._inflight[id(request)] = request
+        self._wake.set()
+        return request
+
+    def end(self, request: _Request):
+        """Stop sampling a request; safe to call more than once"""
+        route = _route(request.scope) or UNMATCHED_ROUTE
+        with self._lock:
+            if self._inflight.pop(id(request), None) is None:
+                return
+            self.sampled_requests += 1
+            self.stacks[route].update(request.stacks)
+            request.stacks.clear()
+
+    # Sampler thread
+    def _run(self):
+        while True:
+            if not self._inflight:
+                self._wake.wait()
+                self._wake.clear()
+            time.sleep(self.interval)
+            try:
+                self._sample()
+            except Exception:
+                # Frames can change under us; drop the tick rather than die
+                pass
+
+    def _sample(self):
+        with self._lock:
+            requests = list(self._inflight.values())
+        if not requests:
+            return
+
+        thread_frames = sys._current_frames()
+        for request in requests:
+            stack = self._request_stack(request, thread_frames.get(request.thread_id))
+            if not stack:
+                continue
+            route = _route(request.scope)
+            with self._lock:
+                if id(request) not in self._inflight:
+                    continue
+                self.samples += 1
+                request.stacks[stack] += 1
+                # Held back only until routing names the request
+                if route is not None:
+                    self.stacks[route].update(request.stacks)
+                    request.stacks.clear()
+
+    def _request_stack(self, request: _Request, thread_frame) -> Optional[str]:
+        # Follow the await chain from the task's outermost coroutine
+        frames = []
+        awaiting = request.task.get_coro()
+        while awaiting is not None:
+            frame = getattr(awaiting, "cr_frame", None) or getattr(awaiting, "gi_frame", None)
+            if frame is None:
+                break
+            frames.append(frame)
+            awaiting = getattr(awaiting, "cr_await", None) or getattr(awaiting, "gi_yieldfrom", None)
+        if not frames:
+            return None
+
+        # Drop the server frames above the profiling middleware
+        for i, frame in enumerate(frames):
+            if frame.f_code is ProfilerMiddleware.__call__.__code__:
+                frames = frames[i + 1:]
+                break
+        if not frames:
+            return None
+        labels = [_frame_label(f) for f in frames]
+
+        if awaiting is not None:
+            labels.append("<waiting>")
+            return ";".join(labels)
+
+        # On the CPU: add the synchronous frames below the innermost coroutine
+        running = []
+        frame = thread_frame
+        while frame is not None and frame is not frames[-1]:
+            running.append(frame)
+            frame = frame.f_back
+        if frame is None:
+            labels.append("<queued>")
+        else:
+            labels.extend(_frame_label(f) for f in reversed(running))
+        return ";".join(labels)
+
+
+class ProfilerMiddleware:
+    """ASGI middleware handing a sample of requests to the profiler"""
+
+    def __init__(self, app, profiler: SamplingProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        request = self.profiler.begin(scope)
+        if request is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_watch(message):
+            # An event stream stays open as long as its client: stop
+            # sampling it once it starts rather than hold the sampler
+            if message["type"] == "http.response.start" and _is_event_stream(message):
+                self.profiler.end(request)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_watch)
+        finally:
+            self.profiler.end(request)
+
+
+_settings = get_settings()
+profiler = SamplingProfiler(
+    enabled=_settings.PROFILER_ENABLED,
+    sample_rate=_settings.PROFILER_SAMPLE_RATE,
+    interval_ms=_settings.PROFILER_INTERVAL_MS,
+)
@@ -0,0 +1,70 @@
+import hashlib
+from typing import Any, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+from backend.app.core.cache import TTLCache
+from backend.app.core.config import get_settings
+
+
+class CachedResponse:
+    """A serialized JSON body with its strong ETag and extra headers"""
+
+    __slots__ = ("body", "etag", "headers")
+
+    def __init__(self, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.headers = headers or {}
+
+    def respond(self, request: Request) -> Response:
+        """Return 304 when the client already holds this version"""
+        headers = {**self.headers, "ETag": self.etag}
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+class ResponseCache:
+    """Server-side cache of anonymous responses.
+
+    Entries are dropped as a whole by invalidate() whenever a write changes
+    the cached data; the TTL bounds staleness caused by writes handled by
+    other worker processes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        return self._entries.get(key)
+
+    def set(
+        self, key: Hashable, content: Any, headers: Optional[Dict[str, str]] = None
+    ) -> CachedResponse:
+        entry = CachedResponse(ORJSONResponse(content).body, headers)
+        self._entries.set(key, entry)
+        return entry
+
+    def invalidate(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return self._entries.stats()
+
+
+# Anonymous GET /projects and GET /projects/{project_id}
+project_response_cache = ResponseCache(
+    maxsize=get_settings().RESPONSE_CACHE_MAX_SIZE,
+    ttl=get_settings().RESPONSE_CACHE_TTL_SECONDS,
+)
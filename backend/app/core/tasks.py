@@ -0,0 +1,142 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from backend.app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    __slots__ = ("name", "func", "args", "kwargs", "retries", "retry_if", "attempt")
+
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], args, kwargs, retries: int,
+                 retry_if: Optional[Callable[[Exception], bool]]):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.retries = retries
+        self.retry_if = retry_if
+        self.attempt = 0
+
+
+class TaskQueue:
+    """In-process queue for work that can finish after the response.
+
+    A fixed number of worker tasks run jobs, so deferred work never takes
+    more than ``concurrency`` database connections. Failed jobs are
+    retried with exponential backoff; ``drain()`` on shutdown waits for
+    everything queued, including retries that are still backing off.
+    Jobs that are not idempotent pass ``retry_if`` to retry only errors
+    that prove the work was not applied.
+
+    Jobs live in memory only: anything still queued when the process is
+    killed is lost, so jobs must be safe to skip or to redo later (the
+    completion counters can be rebuilt with database.backfill_counters).
+    """
+
+    def __init__(self, concurrency: int = 4, max_retries: int = 3, retry_delay: float = 0.5):
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._pending = 0
+        self._idle: Optional[asyncio.Event] = None
+        self.running = 0
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+
+    def start(self):
+        """Start the workers on the running loop (also done by the first enqueue)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # Workers get a clean context: when started lazily from a request
+        # they must not charge their queries to that request's metrics
+        self._workers = [
+            contextvars.Context().run(asyncio.create_task, self._worker(), name=f"task-queue-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    def enqueue(self, name: str, func: Callable[..., Awaitable[Any]], *args,
+                retries: Optional[int] = None,
+                retry_if: Optional[Callable[[Exception], bool]] = None, **kwargs):
+        """Schedule ``await func(*args, **kwargs)``; returns immediately"""
+        self.start()
+        job = _Job(name, func, args, kwargs, self.max_retries if retries is None else retries, retry_if)
+        self._pending += 1
+        self._idle.clear()
+        self._queue.put_nowait(job)
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued jobs and stop the workers; False if the timeout hit"""
+        if not self._workers:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            drained = True
+        except asyncio.TimeoutError:
+            logger.warning("Task queue drain timed out with %d jobs pending", self._pending)
+            drained = False
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return drained
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._pending,
+            "running": self.running,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+    def _done(self):
+        self._pending -= 1
+        if not self._pending:
+            self._idle.set()
+
+    def _retry_later(self, job: _Job):
+        delay = self.retry_delay * 2 ** (job.attempt - 1)
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, job)
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            job.attempt += 1
+            self.running += 1
+            try:
+                await job.func(*job.args, **job.kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if job.attempt <= job.retries and (job.retry_if is None or job.retry_if(e)):
+                    self.retried += 1
+                    logger.warning("Task %s failed (attempt %d), retrying", job.name, job.attempt)
+                    self._retry_later(job)
+                else:
+                    self.failed += 1
+                    logger.exception("Task %s failed after %d attempts", job.name, job.attempt)
+                    self._done()
+            else:
+                self.completed += 1
+                self._done()
+            finally:
+                self.running -= 1
+
+
+_settings = get_settings()
+task_queue = TaskQueue(
+    concurrency=_settings.TASK_CONCURRENCY,
+    max_retries=_settings.TASK_MAX_RETRIES,
+    retry_delay=_settings.TASK_RETRY_DELAY_SECONDS,
+)
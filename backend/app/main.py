@@ -1,24 +1,55 @@
-from dotenv import load_dotenv
-load_dotenv()
-
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
 from datetime import datetime
+from typing import List, Literal, Optional
 from bson import ObjectId
-
-from database.connection import (
-    projects_collection,
-    project_completions,
-    init_database,
+import orjson
+
+from database.connection import Database, get_database, close_database
+from database.pool_metrics import pool_metrics
+from backend.app.schemas.schemas import (
+    CompletionBulkCreate,
+    ProjectBulkCreate,
+    ProjectCreate,
+    ProjectResponse,
+    ProjectUpdate,
+)
+from backend.app.services.services import CompletionService
+from backend.app.services.project_query import ProjectQuery, project_query_params
+from backend.app.services.serializers import (
+    parse_fields,
+    project_projection,
+    serialize_project,
+)
+from backend.app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursor,
 )
-from backend.app.schemas.schemas import ProjectCreate, ProjectUpdate, ProjectResponse
 from backend.app.core.dependencies import (
     get_current_user,
     get_current_user_optional,
+    get_db,
+    user_cache_stats,
 )
 from backend.app.api.auth import router as auth_router
-
-app = FastAPI(title="Freelance Projects API")
+from backend.app.api.admin import router as admin_router
+from backend.app.core.config import get_settings
+from backend.app.core.jwt_utils import bcrypt_stats, shutdown_password_pool
+from backend.app.core.response_cache import project_response_cache
+from backend.app.core.metrics import MetricsMiddleware, render_prometheus, request_metrics
+from backend.app.core.profiler import ProfilerMiddleware, profiler
+from backend.app.core.tasks import task_queue
+from backend.app.services.completion_cache import completion_cache
+from backend.app.services.email_service import email_service
+from backend.app.services.project_feed import project_feed
+
+app = FastAPI(
+    title="Freelance Projects API",
+    default_response_class=ORJSONResponse,
+)
 
 
 # =====================================================
@@ -34,21 +65,45 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
 )
 
+# Sampled request profiling, controlled from /admin/profiler
+app.add_middleware(ProfilerMiddleware, profiler=profiler)
+
+# Request timing and per-request Mongo command counts (/metrics)
+app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+
 
 # =====================================================
 # STARTUP – INIT INDEXES
 # =====================================================
 @app.on_event("startup")
 async def startup_event():
-    await init_database()
+    database = get_database()
+    await database.warm_up()
+    await database.init()
+    task_queue.start()
+    email_service.start()
+    await project_feed.start(database.projects)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await project_feed.close()
+    # Finish deferred writes while the database is still open, then
+    # flush queued email
+    await task_queue.drain(get_settings().TASK_DRAIN_TIMEOUT_SECONDS)
+    await email_service.drain(get_settings().TASK_DRAIN_TIMEOUT_SECONDS)
+    shutdown_password_pool()
+    close_database()
 
 
 # =====================================================
 # ROUTERS
 # =====================================================
 app.include_router(auth_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -56,70 +111,275 @@ def root():
     return {"status": "Backend running"}
 
 
+@app.get("/health/db")
+def database_health():
+    return {"pool": pool_metrics.snapshot(), "tasks": task_queue.stats()}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(
+        render_prometheus(request_metrics, {
+            "bcrypt": bcrypt_stats,
+            "user_cache": user_cache_stats(),
+            "completion_cache": completion_cache.stats(),
+            "response_cache": project_response_cache.stats(),
+            "email": email_service.stats(),
+            "project_feed": project_feed.stats(),
+        }),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+# =====================================================
+# LISTING VIEWS (SUMMARY / FIELD PROJECTION)
+# =====================================================
+def listing_fields(fields: Optional[str]):
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 # =====================================================
 # GET ALL PROJECTS (OPTIONAL USER COMPLETION)
 # =====================================================
 @app.get("/projects")
-async def get_projects(current_user=Depends(get_current_user_optional)):
-    projects = []
+async def get_projects(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: Literal["summary", "full"] = "full",
+    fields: Optional[str] = None,
+    filters: ProjectQuery = Depends(project_query_params),
+    current_user=Depends(get_current_user_optional),
+    db: Database = Depends(get_db),
+):
+    selected = listing_fields(fields)
+    projection = project_projection(view, selected)
+    if projection is not None:
+        projection[filters.sort_field] = 1
+
+    # Anonymous feeds are identical for everyone: serve them from the cache
+    cache_key = None
+    if not current_user:
+        cache_key = ("projects", limit, cursor, view, selected, filters.cache_key())
+        cached = project_response_cache.get(cache_key)
+        if cached:
+            return cached.respond(request)
+
+    headers = {}
+
+    # Keyset pagination is opt-in: without limit/cursor the full feed is returned
+    page_size = limit or (DEFAULT_PAGE_SIZE if cursor else None)
+    if page_size:
+        try:
+            docs, next_cursor = await db.projects.page(
+                filters, page_size, cursor, projection
+            )
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+    else:
+        docs = await db.projects.list(filters, projection)
+
+    # One query for the user's completions instead of one per project
+    completed_ids = set()
+    if current_user and docs:
+        completed_ids = await CompletionService.get_completed_project_ids(
+            current_user["id"],
+            [str(p["_id"]) for p in docs] if page_size else None
+        )
 
-    async for p in projects_collection.find().sort("created_at", -1):
-        project_id = str(p["_id"])
+    projects = [
+        serialize_project(
+            p,
+            is_completed=str(p["_id"]) in completed_ids,  # USER-SPECIFIC
+            view=view,
+            fields=selected,
+        )
+        for p in docs
+    ]
 
-        is_completed = False
-        if current_user:
-            completion = await project_completions.find_one({
-                "user_id": current_user["id"],
-                "project_id": project_id
-            })
-            is_completed = completion is not None
+    if cache_key:
+        return project_response_cache.set(
+            cache_key, projects, headers=headers
+        ).respond(request)
 
-        projects.append({
-            "id": project_id,
-            "title": p.get("title"),
-            "description": p.get("description"),
-            "budget": p.get("budget"),
-            "tech_stack": p.get("tech_stack", []),
-            "status": p.get("status", "OPEN"),
-            "created_by": p.get("created_by"),
-            "created_at": (
-                p["created_at"].isoformat()
-                if p.get("created_at") else None
-            ),
-            "isCompleted": is_completed,  # USER-SPECIFIC
-        })
+    return ORJSONResponse(projects, headers=headers)
 
-    return projects
+
+# =====================================================
+# EXPORT ALL PROJECTS (STREAMED NDJSON)
+# =====================================================
+EXPORT_BATCH_SIZE = 500
+
+
+async def _export_projects(db: Database):
+    # Flush one chunk per cursor batch so memory stays flat
+    chunk = []
+    async for p in db.projects.iter_all(EXPORT_BATCH_SIZE):
+        chunk.append(orjson.dumps(serialize_project(p)))
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+@app.get("/projects/export")
+async def export_projects(db: Database = Depends(get_db)):
+    return StreamingResponse(
+        _export_projects(db),
+        media_type="application/x-ndjson",
+    )
 
 
 # =====================================================
-# CREATE PROJECT (AUTH REQUIRED)
+# LIVE PROJECT CHANGES (SERVER-SENT EVENTS)
 # =====================================================
-@app.post("/projects", status_code=200, response_model=ProjectResponse)
-async def create_project(
-    data: ProjectCreate,
-    current_user=Depends(get_current_user),
+@app.get("/projects/stream")
+async def stream_projects(request: Request):
+    """Push project created / updated / deleted deltas instead of re-polling.
+
+    Reconnecting clients send Last-Event-ID and get the events they
+    missed; a "reset" event means refetch GET /projects.
+    """
+    return StreamingResponse(
+        project_feed.stream(request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# =====================================================
+# SEARCH PROJECTS (KEYWORDS / TECH STACK / BUDGET)
+# =====================================================
+@app.get("/projects/search")
+async def search_projects(
+    q: Optional[str] = Query(None, max_length=200),
+    tech_stack: Optional[List[str]] = Query(None),
+    tech_match: Literal["any", "all"] = "any",
+    budget_min: Optional[int] = Query(None, ge=0),
+    budget_max: Optional[int] = Query(None, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["summary", "full"] = "full",
+    current_user=Depends(get_current_user_optional),
+    db: Database = Depends(get_db),
 ):
-    now = datetime.utcnow()
+    docs = await db.projects.search(
+        query=q,
+        tech_stack=tech_stack,
+        match_all=tech_match == "all",
+        budget_min=budget_min,
+        budget_max=budget_max,
+        limit=limit,
+        projection=project_projection(view),
+    )
 
-    project = {
+    completed_ids = set()
+    if current_user and docs:
+        completed_ids = await CompletionService.get_completed_project_ids(
+            current_user["id"],
+            [str(p["_id"]) for p in docs]
+        )
+
+    return ORJSONResponse([
+        serialize_project(
+            p,
+            is_completed=str(p["_id"]) in completed_ids,
+            view=view,
+        )
+        for p in docs
+    ])
+
+
+# =====================================================
+# CREATE PROJECT (AUTH REQUIRED)
+# =====================================================
+def new_project(data: ProjectCreate, owner_id: str, now: datetime) -> dict:
+    return {
         "title": data.title,
         "description": data.description,
         "budget": data.budget,
         "tech_stack": data.tech_stack,
         "status": "OPEN",
-        "created_by": current_user["id"],  # OWNER
+        "created_by": owner_id,  # OWNER
         "created_at": now,
+        "completion_count": 0,
     }
 
-    res = await projects_collection.insert_one(project)
 
-    return {
-        "id": str(res.inserted_id),
-        **project,
-        "created_at": now.isoformat(),
-        "isCompleted": False,
-    }
+@app.post("/projects", status_code=200, response_model=ProjectResponse)
+async def create_project(
+    data: ProjectCreate,
+    current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    project = new_project(data, current_user["id"], datetime.utcnow())
+
+    project = await db.projects.create(project)
+    project_response_cache.invalidate()
+    project_feed.publish("created", str(project["_id"]), project)
+
+    return ORJSONResponse(serialize_project(project, is_completed=False))
+
+
+# =====================================================
+# BULK CREATE PROJECTS (AUTH REQUIRED)
+# =====================================================
+@app.post("/projects/bulk")
+async def create_projects_bulk(
+    data: ProjectBulkCreate,
+    current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
+):
+    now = datetime.utcnow()
+
+    # Validate each item on its own so one bad row does not reject the batch
+    results, projects = [], []
+    for item in data.projects:
+        try:
+            project = new_project(ProjectCreate.model_validate(item), current_user["id"], now)
+        except ValidationError as e:
+            results.append({
+                "status": "invalid",
+                "errors": [
+                    {"loc": list(err["loc"]), "msg": err["msg"]}
+                    for err in e.errors()
+                ],
+            })
+            continue
+        projects.append(project)
+        results.append({"status": "created"})
+
+    # One unordered insert_many for every valid item; rows the server
+    # rejects are reported per item while the others stay inserted
+    failures = await db.projects.create_many(projects)
+    created = [result for result in results if result["status"] == "created"]
+    for index, (result, project) in enumerate(zip(created, projects)):
+        if index in failures:
+            result["status"] = "failed"
+            result["errors"] = [{"loc": [], "msg": failures[index]}]
+            continue
+        result["id"] = str(project["_id"])
+        project_feed.publish("created", result["id"], project)
+    if len(failures) < len(projects):
+        project_response_cache.invalidate()
+
+    return ORJSONResponse({
+        "created": len(projects) - len(failures),
+        "invalid": len(results) - len(projects),
+        "failed": len(failures),
+        "results": results,
+    })
 
 
 # =====================================================
@@ -129,6 +389,7 @@ async def create_project(
 async def mark_project_completed(
     project_id: str,
     current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     if not ObjectId.is_valid(project_id):
         raise HTTPException(
@@ -136,33 +397,20 @@ async def mark_project_completed(
             detail="Invalid project ID"
         )
 
-    project = await projects_collection.find_one(
-        {"_id": ObjectId(project_id)}
-    )
-    if not project:
+    result = await CompletionService.mark_completed(current_user["id"], project_id)
+    if result == "not_found":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    existing = await project_completions.find_one({
-        "user_id": current_user["id"],
-        "project_id": project_id
-    })
-
-    if existing:
+    if result == "duplicate":
         return {
             "id": project_id,
             "isCompleted": True,
             "message": "Already completed"
         }
 
-    await project_completions.insert_one({
-        "user_id": current_user["id"],
-        "project_id": project_id,
-        "completed_at": datetime.utcnow()
-    })
-
     return {
         "id": project_id,
         "isCompleted": True,
@@ -170,13 +418,40 @@ async def mark_project_completed(
     }
 
 
+# =====================================================
+# BULK MARK PROJECTS AS COMPLETED (USER-SPECIFIC)
+# =====================================================
+@app.post("/projects/complete/bulk")
+async def mark_projects_completed_bulk(
+    data: CompletionBulkCreate,
+    current_user=Depends(get_current_user),
+):
+    results = await CompletionService.mark_completed_many(
+        current_user["id"], data.project_ids
+    )
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    return ORJSONResponse({
+        "completed": counts.get("completed", 0),
+        "duplicate": counts.get("duplicate", 0),
+        "not_found": counts.get("not_found", 0),
+        "invalid": counts.get("invalid", 0),
+        "results": results,
+    })
+
+
 # =====================================================
 # GET SINGLE PROJECT (OPTIONAL USER COMPLETION)
 # =====================================================
 @app.get("/projects/{project_id}")
 async def get_project(
     project_id: str,
+    request: Request,
     current_user=Depends(get_current_user_optional),
+    db: Database = Depends(get_db),
 ):
     if not ObjectId.is_valid(project_id):
         raise HTTPException(
@@ -184,9 +459,14 @@ async def get_project(
             detail="Invalid project ID"
         )
 
-    project = await projects_collection.find_one(
-        {"_id": ObjectId(project_id)}
-    )
+    cache_key = None
+    if not current_user:
+        cache_key = ("project", project_id)
+        cached = project_response_cache.get(cache_key)
+        if cached:
+            return cached.respond(request)
+
+    project = await db.projects.get(project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,26 +475,16 @@ async def get_project(
 
     is_completed = False
     if current_user:
-        completion = await project_completions.find_one({
-            "user_id": current_user["id"],
-            "project_id": project_id
-        })
-        is_completed = completion is not None
+        is_completed = await CompletionService.is_completed(
+            current_user["id"], project_id
+        )
 
-    return {
-        "id": str(project["_id"]),
-        "title": project.get("title"),
-        "description": project.get("description"),
-        "budget": project.get("budget"),
-        "tech_stack": project.get("tech_stack", []),
-        "status": project.get("status", "OPEN"),
-        "created_by": project.get("created_by"),
-        "created_at": (
-            project["created_at"].isoformat()
-            if project.get("created_at") else None
-        ),
-        "isCompleted": is_completed,
-    }
+    result = serialize_project(project, is_completed=is_completed)
+
+    if cache_key:
+        return project_response_cache.set(cache_key, result).respond(request)
+
+    return ORJSONResponse(result)
 
 
 # =====================================================
@@ -222,41 +492,72 @@ async def get_project(
 # =====================================================
 @app.get("/projects/completed/me")
 async def get_my_completed_projects(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    order: Literal["asc", "desc"] = "desc",
+    view: Literal["summary", "full"] = "full",
+    fields: Optional[str] = None,
     current_user=Depends(get_current_user),
 ):
-    completed_projects = []
+    selected = listing_fields(fields)
+    headers = {}
+
+    # Paged on completed_at; without limit/cursor every completion is returned
+    page_size = limit or (DEFAULT_PAGE_SIZE if cursor else None)
+    try:
+        pairs, next_cursor = await CompletionService.get_completed_projects(
+            current_user["id"],
+            limit=page_size,
+            cursor=cursor,
+            direction=1 if order == "asc" else -1,
+            projection=project_projection(view, selected),
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+
+    completed_projects = [
+        serialize_project(
+            project,
+            is_completed=True,
+            view=view,
+            fields=selected,
+            completed_at=(
+                completion["completed_at"].isoformat()
+                if completion.get("completed_at") else None
+            ),
+        )
+        for completion, project in pairs
+    ]
 
-    async for completion in project_completions.find(
-        {"user_id": current_user["id"]}
-    ):
-        project_id = completion["project_id"]
+    return ORJSONResponse(completed_projects, headers=headers)
 
-        if ObjectId.is_valid(project_id):
-            project = await projects_collection.find_one(
-                {"_id": ObjectId(project_id)}
-            )
 
-            if project:
-                completed_projects.append({
-                    "id": str(project["_id"]),
-                    "title": project.get("title"),
-                    "description": project.get("description"),
-                    "budget": project.get("budget"),
-                    "tech_stack": project.get("tech_stack", []),
-                    "status": project.get("status", "OPEN"),
-                    "created_by": project.get("created_by"),
-                    "created_at": (
-                        project["created_at"].isoformat()
-                        if project.get("created_at") else None
-                    ),
-                    "isCompleted": True,
-                    "completed_at": (
-                        completion["completed_at"].isoformat()
-                        if completion.get("completed_at") else None
-                    ),
-                })
-
-    return completed_projects
+# =====================================================
+# OWNERSHIP ERRORS
+# =====================================================
+async def check_owner(db: Database, project_id: str, user_id: str, action: str):
+    """Raise 404 or 403 unless the user owns the project.
+
+    Writes put the owner in their filter, so this extra read only runs
+    when a write matched nothing (or there is nothing to write).
+    """
+    project = await db.projects.get(project_id, {"created_by": 1})
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    if project.get("created_by") != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only the project creator can {action} this project"
+        )
 
 
 # =====================================================
@@ -267,6 +568,7 @@ async def edit_project(
     project_id: str,
     data: ProjectUpdate,
     current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     if not ObjectId.is_valid(project_id):
         raise HTTPException(
@@ -274,22 +576,6 @@ async def edit_project(
             detail="Invalid project ID"
         )
 
-    project = await projects_collection.find_one(
-        {"_id": ObjectId(project_id)}
-    )
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-
-    # Check ownership
-    if project.get("created_by") != current_user["id"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the project creator can edit this project"
-        )
-
     # Build update object
     update_data = {}
     if data.title is not None:
@@ -304,6 +590,7 @@ async def edit_project(
         update_data["status"] = data.status
 
     if not update_data:
+        await check_owner(db, project_id, current_user["id"], "edit")
         return {
             "id": project_id,
             "message": "No updates provided"
@@ -311,33 +598,31 @@ async def edit_project(
 
     update_data["updated_at"] = datetime.utcnow()
 
-    await projects_collection.update_one(
-        {"_id": ObjectId(project_id)},
-        {"$set": update_data}
+    # Ownership is part of the update filter: one round trip, no race
+    # between the check and the write
+    updated_project = await db.projects.update(
+        project_id, update_data, owner_id=current_user["id"]
     )
+    if not updated_project:
+        await check_owner(db, project_id, current_user["id"], "edit")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    project_response_cache.invalidate()
+    project_feed.publish("updated", project_id, updated_project)
 
-    updated_project = await projects_collection.find_one(
-        {"_id": ObjectId(project_id)}
+    # Notify the users who completed it after responding
+    task_queue.enqueue(
+        "project_update.notify", CompletionService.notify_project_update,
+        updated_project, [field for field in update_data if field != "updated_at"],
     )
 
-    return {
-        "id": str(updated_project["_id"]),
-        "title": updated_project.get("title"),
-        "description": updated_project.get("description"),
-        "budget": updated_project.get("budget"),
-        "tech_stack": updated_project.get("tech_stack", []),
-        "status": updated_project.get("status", "OPEN"),
-        "created_by": updated_project.get("created_by"),
-        "created_at": (
-            updated_project["created_at"].isoformat()
-            if updated_project.get("created_at") else None
-        ),
-        "updated_at": (
-            updated_project["updated_at"].isoformat()
-            if updated_project.get("updated_at") else None
-        ),
-        "message": "Project updated successfully"
-    }
+    return ORJSONResponse(serialize_project(
+        updated_project,
+        include_updated_at=True,
+        message="Project updated successfully",
+    ))
 
 
 # =====================================================
@@ -347,6 +632,7 @@ async def edit_project(
 async def delete_project(
     project_id: str,
     current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     if not ObjectId.is_valid(project_id):
         raise HTTPException(
@@ -354,30 +640,19 @@ async def delete_project(
             detail="Invalid project ID"
         )
 
-    project = await projects_collection.find_one(
-        {"_id": ObjectId(project_id)}
-    )
-    if not project:
+    # Delete the project (owner only, checked in the same filter)
+    if not await db.projects.delete(project_id, owner_id=current_user["id"]):
+        await check_owner(db, project_id, current_user["id"], "delete")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
+    project_response_cache.invalidate()
+    project_feed.publish("deleted", project_id)
 
-    # Check ownership
-    if project.get("created_by") != current_user["id"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the project creator can delete this project"
-        )
-
-    # Delete the project
-    await projects_collection.delete_one(
-        {"_id": ObjectId(project_id)}
-    )
-
-    # Clean up completions
-    await project_completions.delete_many(
-        {"project_id": project_id}
+    # Clean up completions and the users' completion counters after responding
+    task_queue.enqueue(
+        "project_completions.cascade", CompletionService.remove_project_completions, project_id
     )
 
     return {
@@ -391,31 +666,26 @@ async def delete_project(
 # =====================================================
 @app.get("/projects/user/me")
 async def get_my_projects(
+    view: Literal["summary", "full"] = "full",
+    fields: Optional[str] = None,
     current_user=Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
-    user_projects = []
-
-    async for p in projects_collection.find(
-        {"created_by": current_user["id"]}
-    ).sort("created_at", -1):
-        project_id = str(p["_id"])
-
-        user_projects.append({
-            "id": project_id,
-            "title": p.get("title"),
-            "description": p.get("description"),
-            "budget": p.get("budget"),
-            "tech_stack": p.get("tech_stack", []),
-            "status": p.get("status", "OPEN"),
-            "created_by": p.get("created_by"),
-            "created_at": (
-                p["created_at"].isoformat()
-                if p.get("created_at") else None
-            ),
-            "updated_at": (
-                p.get("updated_at").isoformat()
-                if p.get("updated_at") else None
-            ),
-        })
+    selected = listing_fields(fields)
+    projection = project_projection(view, selected)
+    if projection is not None:
+        projection["updated_at"] = 1
+
+    user_projects = [
+        serialize_project(
+            p,
+            include_updated_at=not selected,
+            view=view,
+            fields=selected,
+        )
+        for p in await db.projects.list(
+            ProjectQuery(created_by=current_user["id"]), projection
+        )
+    ]
 
-    return user_projects
+    return ORJSONResponse(user_projects)
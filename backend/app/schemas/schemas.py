@@ -1,7 +1,12 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from backend.app.core.config import get_settings
+
+# Largest batch accepted by the bulk endpoints, checked while parsing
+BULK_MAX_ITEMS = get_settings().BULK_MAX_ITEMS
+
 
 # =====================================================
 # PROJECT SCHEMAS
@@ -23,6 +28,11 @@ class ProjectUpdate(BaseModel):
     status: Optional[str] = Field(None)
 
 
+class ProjectBulkCreate(BaseModel):
+    """Schema for creating projects in one request; items are validated one by one"""
+    projects: List[Dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class ProjectResponse(BaseModel):
     """Schema for project response with user-specific completion"""
     id: str
@@ -33,6 +43,7 @@ class ProjectResponse(BaseModel):
     status: str
     created_by: Optional[str] = None
     created_at: str
+    completion_count: int = 0
     isCompleted: bool = False  # User-specific completion flag
 
 
@@ -52,6 +63,17 @@ class LoginSchema(BaseModel):
     password: str = Field(..., min_length=6)
 
 
+class ForgotPasswordSchema(BaseModel):
+    """Schema for requesting a password reset email"""
+    email: str = Field(..., min_length=3, max_length=255)
+
+
+class ResetPasswordSchema(BaseModel):
+    """Schema for setting a new password with a reset token"""
+    token: str = Field(..., min_length=1)
+    password: str = Field(..., min_length=6)
+
+
 class UserResponse(BaseModel):
     """Schema for user response"""
     id: str
@@ -67,4 +89,19 @@ class CompletionResponse(BaseModel):
     """Schema for project completion response"""
     id: str
     isCompleted: bool
-    message: Optional[str] = None
\ No newline at end of file
+    message: Optional[str] = None
+
+
+class CompletionBulkCreate(BaseModel):
+    """Schema for marking several projects as completed"""
+    project_ids: List[str] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+# =====================================================
+# ADMIN SCHEMAS
+# =====================================================
+class ProfilerUpdate(BaseModel):
+    """Schema for changing the request profiler at runtime"""
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = Field(None, ge=0, le=1)
+    interval_ms: Optional[float] = Field(None, ge=1, le=1000)
+    reset: bool = False
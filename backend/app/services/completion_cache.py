@@ -0,0 +1,118 @@
+from bisect import bisect_left
+from typing import Awaitable, Callable, Iterable, Optional, Set
+
+from bson import ObjectId
+
+from backend.app.core.cache import TTLCache
+from backend.app.core.config import get_settings
+
+OID_SIZE = 12
+
+
+class CompletionSet:
+    """A user's completed project IDs as one sorted bytes blob.
+
+    Each entry is the 12-byte ObjectId, so a user with 10k completions
+    costs ~120 KB instead of a set of strings, and a membership check is
+    a binary search over fixed-width records.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, project_ids: Iterable[str] = ()):
+        keys = {ObjectId(i).binary for i in project_ids if ObjectId.is_valid(i)}
+        self._data = b"".join(sorted(keys))
+
+    def __len__(self) -> int:
+        return len(self._data) // OID_SIZE
+
+    def __getitem__(self, index: int) -> bytes:
+        # Lets bisect treat the blob as a sorted sequence of records
+        start = index * OID_SIZE
+        return self._data[start:start + OID_SIZE]
+
+    def _find(self, project_id: str):
+        if not ObjectId.is_valid(project_id):
+            return None, -1
+        key = ObjectId(project_id).binary
+        return key, bisect_left(self, key)
+
+    def __contains__(self, project_id: str) -> bool:
+        key, i = self._find(project_id)
+        return key is not None and i < len(self) and self[i] == key
+
+    def add(self, project_id: str):
+        key, i = self._find(project_id)
+        if key is None or (i < len(self) and self[i] == key):
+            return
+        start = i * OID_SIZE
+        self._data = self._data[:start] + key + self._data[start:]
+
+    def discard(self, project_id: str):
+        key, i = self._find(project_id)
+        if key is None or i >= len(self) or self[i] != key:
+            return
+        start = i * OID_SIZE
+        self._data = self._data[:start] + self._data[start + OID_SIZE:]
+
+
+class CompletionCache:
+    """Per-user CompletionSets, loaded once and kept in step with writes.
+
+    A write that lands while a set is loading bumps the user's write
+    count, and the stale load is then returned but not cached.
+
+    Sets live in one worker process and only that process's writes update
+    them. A completion handled by another worker or instance is missed
+    until the entry expires, so the TTL (COMPLETION_CACHE_TTL_SECONDS,
+    5 s by default) bounds how long isCompleted can lag; within it the
+    cache still absorbs the burst of feed and detail reads of a page view.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._sets = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._writes = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(
+        self, user_id: str, load: Callable[[str], Awaitable[Set[str]]]
+    ) -> CompletionSet:
+        completed = self._sets.get(user_id)
+        if completed is not None:
+            return completed
+
+        writes = self._writes.get(user_id, 0)
+        completed = CompletionSet(await load(user_id))
+        if self._writes.get(user_id, 0) == writes:
+            self._sets.set(user_id, completed)
+        return completed
+
+    def _written(self, user_id: str):
+        self._writes.set(user_id, self._writes.get(user_id, 0) + 1)
+
+    # Writes peek, so the hit / miss stats only count reads
+    def added(self, user_id: str, project_id: str):
+        self._written(user_id)
+        completed: Optional[CompletionSet] = self._sets.peek(user_id)
+        if completed is not None:
+            completed.add(project_id)
+
+    def removed(self, user_ids: Iterable[str], project_id: str):
+        for user_id in user_ids:
+            self._written(user_id)
+            completed: Optional[CompletionSet] = self._sets.peek(user_id)
+            if completed is not None:
+                completed.discard(project_id)
+
+    def clear(self):
+        self._sets.clear()
+        self._writes.clear()
+
+    def stats(self) -> dict:
+        return self._sets.stats()
+
+
+_settings = get_settings()
+completion_cache = CompletionCache(
+    maxsize=_settings.COMPLETION_CACHE_MAX_SIZE,
+    ttl=_settings.COMPLETION_CACHE_TTL_SECONDS,
+)
@@ -1,101 +1,476 @@
-# import smtplib
-# import os
-# from email.mime.text import MIMEText
-# from email.mime.multipart import MIMEMultipart
-# from datetime import datetime, timedelta
-# from jose import jwt
-# from .config import SECRET_KEY, ALGORITHM
-
-# # Email configuration from environment
-# SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-# SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-# SMTP_USER = os.getenv("SMTP_USER", "")
-# SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
-# SENDER_EMAIL = os.getenv("SENDER_EMAIL", "noreply@freelance-marketplace.com")
-# FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5174")
-# FRONTEND_URL = os.getenv("FRONTEND_URL", "https://freelance-hub-b79837.netlify.app/")
-
-# def generate_password_reset_token(email: str, expires_in_hours: int = 24) -> str:
-#     """Generate a password reset token that expires in 24 hours"""
-#     expires = datetime.utcnow() + timedelta(hours=expires_in_hours)
-#     payload = {"email": email, "exp": expires}
-#     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-#     return token
-
-
-# def verify_password_reset_token(token: str) -> str | None:
-#     """Verify and extract email from password reset token"""
-#     try:
-#         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-#         email = payload.get("email")
-#         return email
-#     except:
-#         return None
-
-
-# def send_password_reset_email(email: str, reset_token: str) -> bool:
-#     """Send password reset email"""
-#     try:
-#         # Create reset URL
-#         reset_url = f"{FRONTEND_URL}/reset-password?token={reset_token}"
-        
-#         # Create email message
-#         msg = MIMEMultipart()
-#         msg["From"] = SENDER_EMAIL
-#         msg["To"] = email
-#         msg["Subject"] = "Reset Your Freelance Marketplace Password"
-        
-#         # Email body with HTML formatting
-#         html_body = f"""
-#         <html>
-#             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-#                 <div style="max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9; border-radius: 8px;">
-#                     <h2 style="color: #4f46e5;">Reset Your Password</h2>
-                    
-#                     <p>Hi there,</p>
-                    
-#                     <p>We received a request to reset your password. Click the link below to create a new password:</p>
-                    
-#                     <p style="margin: 30px 0;">
-#                         <a href="{reset_url}" style="display: inline-block; padding: 12px 30px; background-color: #4f46e5; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">
-#                             Reset Password
-#                         </a>
-#                     </p>
-                    
-#                     <p>Or copy this link in your browser:</p>
-#                     <p style="word-break: break-all; color: #666; font-size: 12px;">{reset_url}</p>
-                    
-#                     <hr style="border: none; border-top: 1px solid #ddd; margin: 30px 0;">
-                    
-#                     <p style="font-size: 12px; color: #666;">
-#                         <strong>⏱️ This link expires in 24 hours.</strong><br>
-#                         If you didn't request this, please ignore this email.
-#                     </p>
-                    
-#                     <p style="font-size: 12px; color: #666;">
-#                         Best regards,<br>
-#                         <strong>Freelance Marketplace Team</strong>
-#                     </p>
-#                 </div>
-#             </body>
-#         </html>
-#         """
-        
-#         msg.attach(MIMEText(html_body, "html"))
-        
-#         # Send email
-#         if SMTP_USER and SMTP_PASSWORD:
-#             server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-#             server.starttls()
-#             server.login(SMTP_USER, SMTP_PASSWORD)
-#             server.send_message(msg)
-#             server.quit()
-#             return True
-#         else:
-#             print("⚠️ Email service not configured. Token:", reset_token)
-#             print("Reset URL:", reset_url)
-#             return True  # Return True for development without email service
-            
-#     except Exception as e:
-#         print(f"❌ Error sending email: {str(e)}")
-#         return False
+import asyncio
+import hashlib
+import html
+import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from functools import lru_cache
+from string import Template
+from typing import Iterable, List, Optional, Tuple
+
+from jose import JWTError, jwt
+
+from backend.app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+PASSWORD_RESET_TOKEN_TYPE = "password_reset"
+
+
+# =====================================================
+# TEMPLATES
+# =====================================================
+# name -> (subject, text body, html body), filled in with $placeholders
+TEMPLATES = {
+    "password_reset": (
+        "Reset Your Freelance Marketplace Password",
+        """Hi there,
+
+We received a request to reset your password. Open this link to create a new password:
+
+$reset_url
+
+This link expires in $expires_hours hours. If you didn't request this, please ignore this email.
+
+Freelance Marketplace Team
+""",
+        """<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9; border-radius: 8px;">
+            <h2 style="color: #4f46e5;">Reset Your Password</h2>
+            <p>Hi there,</p>
+            <p>We received a request to reset your password. Click the link below to create a new password:</p>
+            <p style="margin: 30px 0;">
+                <a href="$reset_url" style="display: inline-block; padding: 12px 30px; background-color: #4f46e5; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">
+                    Reset Password
+                </a>
+            </p>
+            <p>Or copy this link in your browser:</p>
+            <p style="word-break: break-all; color: #666; font-size: 12px;">$reset_url</p>
+            <hr style="border: none; border-top: 1px solid #ddd; margin: 30px 0;">
+            <p style="font-size: 12px; color: #666;">
+                <strong>This link expires in $expires_hours hours.</strong><br>
+                If you didn't request this, please ignore this email.
+            </p>
+            <p style="font-size: 12px; color: #666;">
+                Best regards,<br>
+                <strong>Freelance Marketplace Team</strong>
+            </p>
+        </div>
+    </body>
+</html>
+""",
+    ),
+    "project_update": (
+        "Project updated: $title",
+        """Hi there,
+
+"$title", a project you completed, was updated: $summary
+
+View it here: $project_url
+
+Freelance Marketplace Team
+""",
+        """<html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9; border-radius: 8px;">
+            <h2 style="color: #4f46e5;">$title</h2>
+            <p>A project you completed was updated: $summary</p>
+            <p style="margin: 30px 0;">
+                <a href="$project_url" style="display: inline-block; padding: 12px 30px; background-color: #4f46e5; color: white; text-decoration: none; border-radius: 5px; font-weight: bold;">
+                    View Project
+                </a>
+            </p>
+            <p style="font-size: 12px; color: #666;">
+                Best regards,<br>
+                <strong>Freelance Marketplace Team</strong>
+            </p>
+        </div>
+    </body>
+</html>
+""",
+    ),
+}
+
+
+@lru_cache
+def _compiled(name: str) -> Tuple[Template, Template, Template]:
+    subject, text, html_body = TEMPLATES[name]
+    return Template(subject), Template(text), Template(html_body)
+
+
+def render_template(name: str, **context) -> Tuple[str, str, str]:
+    """Render a template to (subject, text, html).
+
+    Templates are parsed once; renders are not cached because their
+    context is usually per recipient (a reset link carries its token).
+    Send one rendered message to many recipients with send_template.
+    """
+    subject, text, html_body = _compiled(name)
+    values = {k: str(v) for k, v in context.items()}
+    escaped = {k: html.escape(v) for k, v in values.items()}
+    return (
+        subject.substitute(values),
+        text.substitute(values),
+        html_body.substitute(escaped),
+    )
+
+
+def build_message(to: str, subject: str, text: str, html_body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = settings.SENDER_EMAIL
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(text)
+    message.add_alternative(html_body, subtype="html")
+    return message
+
+
+# =====================================================
+# PASSWORD RESET TOKENS
+# =====================================================
+def _password_fingerprint(password_hash: str) -> str:
+    # Changes with the password, so a token stops working once used
+    return hashlib.sha256(password_hash.encode("utf-8")).hexdigest()[:16]
+
+
+def generate_password_reset_token(
+    email: str, password_hash: str, expires_in_hours: Optional[int] = None
+) -> str:
+    """Generate a password reset token, valid until it expires or is used"""
+    hours = expires_in_hours or settings.PASSWORD_RESET_EXPIRE_HOURS
+    payload = {
+        "email": email,
+        "type": PASSWORD_RESET_TOKEN_TYPE,
+        "pwd": _password_fingerprint(password_hash),
+        "exp": datetime.utcnow() + timedelta(hours=hours),
+    }
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def verify_password_reset_token(token: str) -> Optional[dict]:
+    """Decode a password reset token; None if invalid, expired or not a reset token"""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("type") != PASSWORD_RESET_TOKEN_TYPE or not payload.get("email"):
+        return None
+    return payload
+
+
+def reset_token_matches(payload: dict, password_hash: str) -> bool:
+    return payload.get("pwd") == _password_fingerprint(password_hash)
+
+
+# =====================================================
+# SMTP CONNECTION POOL
+# =====================================================
+class SMTPPool:
+    """Persistent SMTP connections shared by the sender threads.
+
+    A connection is opened (connect, STARTTLS, login) once and then reused
+    for every batch; one idle for longer than ``check_after`` seconds is
+    probed with NOOP before use. Thread safe.
+    """
+
+    def __init__(self, host: str, port: int, user: str = "", password: str = "",
+                 starttls: bool = True, timeout: float = 10, check_after: float = 30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.check_after = check_after
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self.opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.ehlo()
+            if self.starttls:
+                conn.starttls()
+                conn.ehlo()
+            if self.user:
+                conn.login(self.user, self.password)
+        except Exception:
+            conn.close()
+            raise
+        with self._lock:
+            self.opened += 1
+        return conn
+
+    def acquire(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if time.monotonic() - last_used < self.check_after:
+                return conn
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.discard(conn)
+        return self._connect()
+
+    def release(self, conn: smtplib.SMTP):
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    def discard(self, conn: smtplib.SMTP):
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            try:
+                conn.quit()
+            except (smtplib.SMTPException, OSError):
+                self.discard(conn)
+
+    def send_batch(self, messages: List[EmailMessage]) -> Tuple[int, int]:
+        """Send messages over one pooled connection; returns (sent, failed).
+
+        A dropped connection is replaced and the message retried once;
+        a message the server rejects is counted as failed.
+        """
+        sent = failed = 0
+        conn = None
+        try:
+            for message in messages:
+                for attempt in (1, 2):
+                    try:
+                        if conn is None:
+                            conn = self.acquire()
+                        conn.send_message(message)
+                        sent += 1
+                        break
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused,
+                            smtplib.SMTPDataError) as e:
+                        logger.warning("Email to %s rejected: %s", message["To"], e)
+                        failed += 1
+                        break
+                    except (smtplib.SMTPException, OSError) as e:
+                        if conn is not None:
+                            self.discard(conn)
+                            conn = None
+                        if attempt == 2:
+                            logger.error("Email to %s failed: %s", message["To"], e)
+                            failed += 1
+        finally:
+            if conn is not None:
+                self.release(conn)
+        return sent, failed
+
+
+# =====================================================
+# EMAIL SERVICE
+# =====================================================
+class EmailService:
+    """Sends queued emails in batches from a background task.
+
+    Callers only enqueue, so request handlers never wait on SMTP. The
+    dispatcher collects up to ``batch_size`` messages (waiting at most
+    ``batch_wait_ms`` for more) and hands each batch to a thread that
+    sends it over one pooled connection, with at most ``pool_size``
+    batches in flight. Without an SMTP server configured, messages are
+    logged instead of sent.
+    """
+
+    def __init__(self, pool: Optional[SMTPPool], pool_size: int = 2, batch_size: int = 50,
+                 batch_wait_ms: float = 50, max_queue: int = 10000):
+        self.pool = pool
+        self.pool_size = max(1, pool_size)
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait_ms / 1000
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._inflight = set()
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.send_seconds = 0.0
+
+    def start(self):
+        """Start the dispatcher on the running loop (also done by the first send)"""
+        if self._dispatcher is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._slots = asyncio.Semaphore(self.pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="smtp")
+        self._dispatcher = asyncio.create_task(self._dispatch(), name="email-dispatcher")
+
+    def send(self, message: EmailMessage) -> bool:
+        """Queue a message; False if the queue is full and it was dropped"""
+        self.start()
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Email queue full, dropping message to %s", message["To"])
+            return False
+        self.enqueued += 1
+        return True
+
+    def send_template(self, recipients: Iterable[str], template: str, **context) -> int:
+        """Render a template once and queue it for every recipient"""
+        subject, text, html_body = render_template(template, **context)
+        return sum(
+            self.send(build_message(to, subject, text, html_body)) for to in recipients
+        )
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued, then close the connections"""
+        if self._dispatcher is None:
+            return True
+        drained = True
+        try:
+            await asyncio.wait_for(self._flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Email drain timed out with %d messages queued", self._queue.qsize())
+            drained = False
+
+        self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, *self._inflight, return_exceptions=True)
+        if self.pool is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self.pool.close)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._dispatcher = self._executor = None
+        return drained
+
+    async def _flush(self):
+        # Also covers a batch the dispatcher has taken off the queue but
+        # not handed to a sender yet
+        while self.enqueued - self.sent - self.failed > 0:
+            await asyncio.sleep(0.01)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "connections_opened": self.pool.opened if self.pool is not None else 0,
+            "send_seconds": round(self.send_seconds, 6),
+            "messages_per_second": round(self.sent / self.send_seconds, 1) if self.send_seconds else 0.0,
+        }
+
+    async def _next_batch(self) -> List[EmailMessage]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch(self):
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._next_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+            task = asyncio.create_task(self._send_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send_batch(self, batch: List[EmailMessage]):
+        started = time.perf_counter()
+        try:
+            if self.pool is None:
+                for message in batch:
+                    # The body can hold links with tokens, so it is never logged
+                    logger.warning("Email not configured (no SMTP_SERVER), not sending to %s: %s",
+                                   message["To"], message["Subject"])
+                sent, failed = len(batch), 0
+            else:
+                loop = asyncio.get_running_loop()
+                sent, failed = await loop.run_in_executor(self._executor, self.pool.send_batch, batch)
+        except Exception:
+            logger.exception("Email batch of %d failed", len(batch))
+            sent, failed = 0, len(batch)
+        finally:
+            self._slots.release()
+        self.send_seconds += time.perf_counter() - started
+        self.sent += sent
+        self.failed += failed
+        self.batches += 1
+
+
+# =====================================================
+# NOTIFICATIONS
+# =====================================================
+def send_password_reset_email(email: str, reset_token: str) -> bool:
+    """Queue the password reset email"""
+    return email_service.send_template(
+        [email],
+        "password_reset",
+        reset_url=f"{settings.FRONTEND_URL}/reset-password?token={reset_token}",
+        expires_hours=settings.PASSWORD_RESET_EXPIRE_HOURS,
+    ) == 1
+
+
+def send_project_update_emails(recipients: Iterable[str], project: dict, summary: str) -> int:
+    """Queue one project update notification per recipient, rendered once"""
+    return email_service.send_template(
+        recipients,
+        "project_update",
+        title=project["title"],
+        summary=summary,
+        project_url=f"{settings.FRONTEND_URL}/projects/{project['_id']}",
+    )
+
+
+def create_email_service() -> EmailService:
+    pool = None
+    if settings.SMTP_SERVER:
+        pool = SMTPPool(
+            settings.SMTP_SERVER,
+            settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            starttls=settings.SMTP_STARTTLS,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+        )
+    return EmailService(
+        pool,
+        pool_size=settings.EMAIL_POOL_SIZE,
+        batch_size=settings.EMAIL_BATCH_SIZE,
+        batch_wait_ms=settings.EMAIL_BATCH_WAIT_MS,
+        max_queue=settings.EMAIL_QUEUE_MAX_SIZE,
+    )
+
+
+email_service = create_email_service()
@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import secrets
+from collections import deque
+from typing import AsyncIterator, Optional, Set
+
+import orjson
+from pymongo.errors import OperationFailure, PyMongoError
+
+from backend.app.core.config import get_settings
+from backend.app.services.serializers import serialize_project
+
+logger = logging.getLogger(__name__)
+
+# Sent when a client may have missed events and should refetch the list
+RESET_FRAME = b"event: reset\ndata: {}\n\n"
+CONNECTED_FRAME = b": connected\n\n"
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# Resume token no longer in the oplog: reopen from now
+HISTORY_LOST_CODES = {280, 286}
+
+
+class _Subscriber:
+    __slots__ = ("queue", "closed")
+
+    def __init__(self, size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(2, size))
+        self.closed = False
+
+    def push(self, frame: Optional[bytes]):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.close(RESET_FRAME)
+
+    def close(self, frame: Optional[bytes] = None):
+        if self.closed:
+            return
+        # Drop the backlog so the final frames always fit
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        if frame is not None:
+            self.queue.put_nowait(frame)
+        self.queue.put_nowait(None)
+        self.closed = True
+
+
+class ProjectFeed:
+    """Project create / update / delete deltas fanned out to SSE clients.
+
+    One feed per worker: each change is serialized into an event frame
+    once and the same bytes are queued for every subscriber. Changes come
+    from a Mongo change stream when the deployment supports one, so every
+    worker sees every write; otherwise ("local") the write handlers
+    publish them, which only reaches clients of the same process.
+
+    Events carry "<epoch>-<seq>" IDs and the last ``replay_size`` frames
+    are kept, so a client reconnecting with Last-Event-ID gets what it
+    missed. A client that is too far behind (or was too slow and had its
+    queue overflow) gets a "reset" event telling it to refetch.
+    """
+
+    def __init__(self, source: str = "auto", queue_size: int = 256,
+                 replay_size: int = 1000, heartbeat: float = 15):
+        self.source = source
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.epoch = secrets.token_hex(4)
+        self._seq = 0
+        self._replay = deque(maxlen=replay_size)
+        self._subscribers: Set[_Subscriber] = set()
+        self._watcher: Optional[asyncio.Task] = None
+        self._resume_token = None
+        self.following = False
+        self.published = 0
+        self.dropped = 0
+
+    # Sources
+    async def start(self, projects):
+        """Follow the projects change stream in the background if the source allows it.
+
+        Never waits on the database: until the stream is open, changes are
+        published in-process, so an outage at boot cannot block or fail
+        startup.
+        """
+        if self.source == "local" or self._watcher is not None:
+            return
+        self._watcher = asyncio.create_task(self._watch(projects), name="project-feed")
+
+    def publish(self, kind: str, project_id: str, project: Optional[dict] = None):
+        """Publish a change made by this process (no-op once following a change stream)"""
+        if not self.following:
+            self._emit(kind, project_id, project)
+
+    async def _watch(self, projects):
+        delay = 1
+        while True:
+            try:
+                stream = projects.watch(resume_after=self._resume_token)
+                if stream is None:
+                    raise NotImplementedError("storage backend has no change stream")
+                async with stream:
+                    if not self.following:
+                        # Opens the stream so an unsupported deployment fails here
+                        change = await stream.try_next()
+                        self._on_open()
+                        if change is not None:
+                            self._on_change(change)
+                    async for change in stream:
+                        self._on_change(change)
+                        delay = 1
+            except (PyMongoError, NotImplementedError) as e:
+                if isinstance(e, OperationFailure) and e.code in HISTORY_LOST_CODES:
+                    logger.warning("Project change stream history lost, clients will refetch: %s", e)
+                    self._resume_token = None
+                    self._reset_all()
+                    continue
+                if not self.following and isinstance(e, (OperationFailure, NotImplementedError)):
+                    if self.source == "auto":
+                        print(f"Change streams unavailable, publishing project changes in-process: {e}")
+                        self.source = "local"
+                        return
+                    logger.error("Project change stream unavailable, retrying in %ss: %s", delay, e)
+                else:
+                    logger.warning("Project change stream interrupted, reopening in %ss: %s", delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+    def _on_open(self):
+        # Writes made by other workers before now were never seen
+        self.following = True
+        self._reset_all()
+
+    def _on_change(self, change: dict):
+        self._resume_token = change["_id"]
+        operation = change["operationType"]
+        project_id = str(change["documentKey"]["_id"])
+        if operation == "delete":
+            self._emit("deleted", project_id)
+            return
+        project = change.get("fullDocument")
+        if project is not None:  # None when deleted before the lookup
+            self._emit("created" if operation == "insert" else "updated", project_id, project)
+
+    # Fan-out
+    def _emit(self, kind: str, project_id: str, project: Optional[dict] = None):
+        data = {"id": project_id}
+        if project is not None:
+            data["project"] = serialize_project(project, include_updated_at=True)
+
+        self._seq += 1
+        frame = b"id: %s-%d\nevent: %s\ndata: %s\n\n" % (
+            self.epoch.encode(), self._seq, kind.encode(), orjson.dumps(data)
+        )
+        self._replay.append((self._seq, frame))
+        self.published += 1
+        for subscriber in tuple(self._subscribers):
+            subscriber.push(frame)
+            if subscriber.closed:
+                self._drop(subscriber)
+
+    def _drop(self, subscriber: _Subscriber):
+        self._subscribers.discard(subscriber)
+        self.dropped += 1
+
+    def _reset_all(self):
+        for subscriber in tuple(self._subscribers):
+            subscriber.push(RESET_FRAME)
+            if subscriber.closed:
+                self._drop(subscriber)
+
+    def _missed(self, last_event_id: str):
+        """Frames after last_event_id, or None if they are not all in the buffer"""
+        epoch, _, seq = last_event_id.rpartition("-")
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > self._seq:
+            return None
+        seq = int(seq)
+        oldest = self._replay[0][0] if self._replay else self._seq + 1
+        if seq + 1 < oldest:
+            return None
+        return [frame for s, frame in self._replay if s > seq]
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """Server-sent event frames for one client, until it disconnects"""
+        subscriber = _Subscriber(self.queue_size)
+        if last_event_id:
+            missed = self._missed(last_event_id)
+            for frame in missed if missed is not None else (RESET_FRAME,):
+                subscriber.push(frame)
+        if subscriber.closed:
+            self.dropped += 1
+        else:
+            self._subscribers.add(subscriber)
+
+        try:
+            yield CONNECTED_FRAME
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscriber.queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE_FRAME
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def close(self):
+        """Stop following changes and end every subscriber's stream"""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+            self.following = False
+        for subscriber in tuple(self._subscribers):
+            subscriber.close()
+        self._subscribers.clear()
+
+    def stats(self) -> dict:
+        return {
+            "change_stream": int(self.following),
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+_settings = get_settings()
+project_feed = ProjectFeed(
+    source=_settings.PROJECT_FEED_SOURCE,
+    queue_size=_settings.PROJECT_FEED_QUEUE_SIZE,
+    replay_size=_settings.PROJECT_FEED_REPLAY_SIZE,
+    heartbeat=_settings.PROJECT_FEED_HEARTBEAT_SECONDS,
+)
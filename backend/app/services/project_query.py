@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+from typing import List, Literal, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, field_validator
+
+# Sort keys clients may use with ?sort=; prefix with "-" for descending.
+# Each one is backed by a compound index created in init_database.
+SORT_FIELDS = ("created_at", "budget")
+
+
+class ProjectQuery(BaseModel):
+    """Filters and sort order for project listings"""
+    status: Optional[str] = None
+    budget_min: Optional[int] = None
+    budget_max: Optional[int] = None
+    tech_stack: Optional[List[str]] = None
+    tech_match: Literal["any", "all"] = "any"
+    created_by: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    sort: str = "-created_at"
+
+    @field_validator("created_after", "created_before")
+    @classmethod
+    def naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # Stored created_at values are naive UTC; "...Z" or "+02:00" in the
+        # query string parses as aware, which the in-memory filter cannot
+        # compare with them
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @property
+    def sort_field(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def direction(self) -> int:
+        return -1 if self.sort.startswith("-") else 1
+
+    def sort_spec(self) -> List[Tuple[str, int]]:
+        return [(self.sort_field, self.direction), ("_id", self.direction)]
+
+    def to_mongo(self) -> dict:
+        """Translate the filters into a Mongo query.
+
+        Equality filters come first, then ranges, matching the field order
+        of the compound indexes (equality, sort, range).
+        """
+        query = {}
+        if self.status:
+            query["status"] = self.status
+        if self.created_by:
+            query["created_by"] = self.created_by
+        if self.tech_stack:
+            op = "$all" if self.tech_match == "all" else "$in"
+            query["tech_stack"] = {op: self.tech_stack}
+
+        budget = {}
+        if self.budget_min is not None:
+            budget["$gte"] = self.budget_min
+        if self.budget_max is not None:
+            budget["$lte"] = self.budget_max
+        if budget:
+            query["budget"] = budget
+
+        created_at = {}
+        if self.created_after is not None:
+            created_at["$gte"] = self.created_after
+        if self.created_before is not None:
+            created_at["$lt"] = self.created_before
+        if created_at:
+            query["created_at"] = created_at
+
+        return query
+
+    def cache_key(self) -> tuple:
+        return tuple(
+            tuple(v) if isinstance(v, list) else v
+            for v in self.model_dump().values()
+        )
+
+
+def project_query_params(
+    status_filter: Optional[str] = Query(None, alias="status"),
+    budget_min: Optional[int] = Query(None, ge=0),
+    budget_max: Optional[int] = Query(None, ge=0),
+    tech_stack: Optional[List[str]] = Query(None),
+    tech_match: Literal["any", "all"] = "any",
+    created_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    sort: str = "-created_at",
+) -> ProjectQuery:
+    """FastAPI dependency parsing listing filters from the query string"""
+    if sort.lstrip("-") not in SORT_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sort key; use one of: {', '.join(SORT_FIELDS)}"
+        )
+
+    return ProjectQuery(
+        status=status_filter,
+        budget_min=budget_min,
+        budget_max=budget_max,
+        tech_stack=tech_stack,
+        tech_match=tech_match,
+        created_by=created_by,
+        created_after=created_after,
+        created_before=created_before,
+        sort=sort,
+    )
@@ -0,0 +1,250 @@
+import heapq
+import re
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from pymongo.errors import OperationFailure
+
+from backend.app.core.config import get_settings
+
+# Keeps tokens like "c++", "c#" and "node.js" intact
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# Same relative weights as the Mongo text index created in init_database
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    if not text:
+        return set()
+    return {t.rstrip(".") for t in TOKEN_RE.findall(text.lower())}
+
+
+class InvertedIndex:
+    """In-process keyword and tech-stack index over project documents.
+
+    Used when the database cannot run ``$text`` queries (local mongod
+    without the index, mocks, the in-memory backend).
+    """
+
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._terms: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._tech: Dict[str, Set[str]] = defaultdict(set)
+        self._newest_first: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, project: dict):
+        project_id = str(project["_id"])
+        if project_id in self._docs:
+            self.remove(project_id)
+
+        self._docs[project_id] = project
+        weights = defaultdict(int)
+        for term in tokenize(project.get("title")):
+            weights[term] += TITLE_WEIGHT
+        for term in tokenize(project.get("description")):
+            weights[term] += DESCRIPTION_WEIGHT
+        for term, weight in weights.items():
+            self._terms[term][project_id] = weight
+        for tech in project.get("tech_stack") or []:
+            self._tech[tech].add(project_id)
+        self._newest_first = None
+
+    def remove(self, project_id: str):
+        project = self._docs.pop(project_id, None)
+        if project is None:
+            return
+
+        terms = tokenize(project.get("title")) | tokenize(project.get("description"))
+        for term in terms:
+            postings = self._terms.get(term)
+            if postings is not None:
+                postings.pop(project_id, None)
+                if not postings:
+                    del self._terms[term]
+        for tech in project.get("tech_stack") or []:
+            ids = self._tech.get(tech)
+            if ids is not None:
+                ids.discard(project_id)
+                if not ids:
+                    del self._tech[tech]
+        self._newest_first = None
+
+    def _ordered_ids(self) -> List[str]:
+        if self._newest_first is None:
+            self._newest_first = sorted(
+                self._docs,
+                key=lambda i: (self._docs[i].get("created_at") or datetime.min, i),
+                reverse=True,
+            )
+        return self._newest_first
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tech_stack: Optional[Iterable[str]] = None,
+        match_all: bool = False,
+        budget_min: Optional[int] = None,
+        budget_max: Optional[int] = None,
+        limit: int = 20,
+    ) -> List[dict]:
+        candidates: Optional[Set[str]] = None
+
+        tech_stack = list(tech_stack or [])
+        if tech_stack:
+            sets = [self._tech.get(t, set()) for t in tech_stack]
+            candidates = set.intersection(*sets) if match_all else set().union(*sets)
+
+        def in_budget(project_id: str) -> bool:
+            budget = self._docs[project_id].get("budget")
+            if budget_min is not None and (budget is None or budget < budget_min):
+                return False
+            if budget_max is not None and (budget is None or budget > budget_max):
+                return False
+            return True
+
+        terms = tokenize(query)
+        if not terms:
+            # No ranking: walk the newest-first order and stop at the limit
+            results = []
+            for project_id in self._ordered_ids():
+                if candidates is not None and project_id not in candidates:
+                    continue
+                if in_budget(project_id):
+                    results.append(self._docs[project_id])
+                    if len(results) >= limit:
+                        break
+            return results
+
+        # Any term may match (like $text); score is the summed term weight
+        if len(terms) == 1 and candidates is None:
+            scores = self._terms.get(next(iter(terms)), {})
+        else:
+            scores = self._score(terms, candidates)
+
+        if budget_min is None and budget_max is None:
+            matched = iter(scores)
+        else:
+            matched = (i for i in scores if in_budget(i))
+
+        docs = self._docs
+        best = heapq.nlargest(
+            limit,
+            matched,
+            key=lambda i: (scores[i], docs[i].get("created_at") or datetime.min),
+        )
+        return [docs[i] for i in best]
+
+    def _score(self, terms: Set[str], candidates: Optional[Set[str]]) -> Dict[str, int]:
+        scores: Dict[str, int] = defaultdict(int)
+        for term in terms:
+            postings = self._terms.get(term, {})
+            if candidates is not None and len(candidates) < len(postings):
+                for project_id in candidates:
+                    weight = postings.get(project_id)
+                    if weight:
+                        scores[project_id] += weight
+            else:
+                for project_id, weight in postings.items():
+                    if candidates is None or project_id in candidates:
+                        scores[project_id] += weight
+        return scores
+
+
+# "text index required for $text query"
+INDEX_NOT_FOUND = 27
+
+
+class ProjectSearch:
+    """Project search backed by Mongo indexes, with an in-process fallback"""
+
+    def __init__(self, backend: str = "auto"):
+        self.backend = backend
+        self._index: Optional[InvertedIndex] = None
+
+    @property
+    def uses_fallback(self) -> bool:
+        return self.backend == "memory"
+
+    async def search(
+        self,
+        collection,
+        query: Optional[str] = None,
+        tech_stack: Optional[List[str]] = None,
+        match_all: bool = False,
+        budget_min: Optional[int] = None,
+        budget_max: Optional[int] = None,
+        limit: int = 20,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        if not self.uses_fallback:
+            try:
+                return await self._search_mongo(
+                    collection, query, tech_stack, match_all,
+                    budget_min, budget_max, limit, projection,
+                )
+            except (OperationFailure, NotImplementedError) as e:
+                # Only a server that cannot run $text at all switches this
+                # process to the in-process index; transient failures and
+                # timeouts are raised rather than pinning a stale copy
+                if self.backend == "mongo" or (
+                    isinstance(e, OperationFailure) and e.code != INDEX_NOT_FOUND
+                ):
+                    raise
+                print(f"Mongo text search unavailable, using in-process index: {e}")
+                self.backend = "memory"
+
+        index = await self._get_index(collection)
+        return index.search(query, tech_stack, match_all, budget_min, budget_max, limit)
+
+    async def _search_mongo(
+        self, collection, query, tech_stack, match_all,
+        budget_min, budget_max, limit, projection,
+    ) -> List[dict]:
+        mongo_query = {}
+        if query:
+            mongo_query["$text"] = {"$search": query}
+        if tech_stack:
+            mongo_query["tech_stack"] = {"$all" if match_all else "$in": tech_stack}
+        budget = {}
+        if budget_min is not None:
+            budget["$gte"] = budget_min
+        if budget_max is not None:
+            budget["$lte"] = budget_max
+        if budget:
+            mongo_query["budget"] = budget
+
+        if query:
+            projection = dict(projection or {})
+            projection["score"] = {"$meta": "textScore"}
+            sort = [("score", {"$meta": "textScore"}), ("created_at", -1)]
+        else:
+            sort = [("created_at", -1), ("_id", -1)]
+
+        cursor = collection.find(mongo_query, projection).sort(sort).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def _get_index(self, collection) -> InvertedIndex:
+        if self._index is None:
+            index = InvertedIndex()
+            async for project in collection.find():
+                index.add(project)
+            self._index = index
+        return self._index
+
+    # Write hooks keep the fallback index current once it has been built
+    def on_upsert(self, project: dict):
+        if self._index is not None:
+            self._index.add(project)
+
+    def on_delete(self, project_id: str):
+        if self._index is not None:
+            self._index.remove(project_id)
+
+
+project_search = ProjectSearch(get_settings().SEARCH_BACKEND)
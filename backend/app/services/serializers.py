@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from backend.app.core.config import get_settings
+
+DESCRIPTION_PREVIEW_LENGTH = get_settings().DESCRIPTION_PREVIEW_LENGTH
+
+# Fields a client may request with ?fields=
+PROJECT_FIELDS = (
+    "title",
+    "description",
+    "budget",
+    "tech_stack",
+    "status",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "completion_count",
+)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple]:
+    """Parse a comma separated ?fields= value; raises ValueError on unknown fields"""
+    if not fields:
+        return None
+
+    requested = tuple(f.strip() for f in fields.split(",") if f.strip())
+    unknown = [f for f in requested if f not in PROJECT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def project_projection(
+    view: str = "full", fields: Optional[Iterable[str]] = None
+) -> Optional[dict]:
+    """Build the Mongo projection for a listing view and field whitelist.
+
+    ``created_at`` is always kept because keyset pagination sorts on it.
+    In the summary view the description is cut by the server so the full
+    text never leaves Mongo.
+    """
+    if fields:
+        projection = {f: 1 for f in fields}
+    elif view == "summary":
+        projection = {f: 1 for f in PROJECT_FIELDS}
+    else:
+        return None
+
+    projection["created_at"] = 1
+    if view == "summary" and "description" in projection:
+        description = {"$ifNull": ["$description", ""]}
+        projection["description"] = {
+            "$substrCP": [description, 0, DESCRIPTION_PREVIEW_LENGTH]
+        }
+        projection["description_length"] = {"$strLenCP": description}
+    return projection
+
+
+def serialize_project(
+    project: dict,
+    is_completed: Optional[bool] = None,
+    include_updated_at: bool = False,
+    view: str = "full",
+    fields: Optional[Iterable[str]] = None,
+    **extra,
+) -> dict:
+    """Format a project document as returned by the /projects endpoints.
+
+    ``isCompleted`` is only included when ``is_completed`` is given, and
+    ``extra`` keys are appended as-is (e.g. ``completed_at``, ``message``).
+    """
+    data = {
+        "id": str(project["_id"]),
+        "title": project.get("title"),
+        "description": project.get("description"),
+        "budget": project.get("budget"),
+        "tech_stack": project.get("tech_stack", []),
+        "status": project.get("status", "OPEN"),
+        "created_by": project.get("created_by"),
+        "created_at": _isoformat(project.get("created_at")),
+        "completion_count": project.get("completion_count", 0),
+    }
+    if include_updated_at or (fields and "updated_at" in fields):
+        data["updated_at"] = _isoformat(project.get("updated_at"))
+
+    if view == "summary":
+        description = data["description"] or ""
+        length = project.get("description_length", len(description))
+        data["description"] = description[:DESCRIPTION_PREVIEW_LENGTH]
+        data["description_truncated"] = length > DESCRIPTION_PREVIEW_LENGTH
+
+    if fields:
+        keep = set(fields) | {"id"}
+        if view == "summary" and "description" in keep:
+            keep.add("description_truncated")
+        data = {k: v for k, v in data.items() if k in keep}
+
+    if is_completed is not None:
+        data["isCompleted"] = is_completed
+    if extra:
+        data.update(extra)
+    return data
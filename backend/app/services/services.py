@@ -1,10 +1,23 @@
-from typing import List, Optional
-from bson import ObjectId
+from typing import Iterable, List, Optional, Set, Tuple
 from datetime import datetime
-from database.connection import db as client_db
+from bson import ObjectId
+from pymongo.errors import ServerSelectionTimeoutError, WaitQueueTimeoutError
+from database.connection import get_database
+from backend.app.services.project_query import ProjectQuery
+from backend.app.services.completion_cache import completion_cache
+from backend.app.core.response_cache import project_response_cache
+from backend.app.core.tasks import task_queue
+from backend.app.services.email_service import send_project_update_emails
 from database.models import ProjectCreate, ProjectUpdate, ProjectStatus, Project
 
 
+def _not_sent(e: Exception) -> bool:
+    """The counter jobs use $inc, so they are only retried when the update
+    never reached a server; any other failure may already be applied.
+    Counts lost that way are repaired by database.backfill_counters."""
+    return isinstance(e, (ServerSelectionTimeoutError, WaitQueueTimeoutError))
+
+
 class ProjectService:
     @staticmethod
     def _project_helper(project) -> dict:
@@ -23,40 +36,46 @@ class ProjectService:
     @staticmethod
     async def create_project(project: ProjectCreate, created_by: str) -> dict:
         """Create a new project"""
-        db = client_db
+        db = get_database()
         project_dict = project.model_dump()
         project_dict["status"] = ProjectStatus.OPEN
-        project_dict["created_by"] = ObjectId(created_by)
+        project_dict["created_by"] = created_by
         project_dict["created_at"] = datetime.utcnow()
+        project_dict["completion_count"] = 0
 
-        result = await db.projects.insert_one(project_dict)
-        new_project = await db.projects.find_one({"_id": result.inserted_id})
+        new_project = await db.projects.create(project_dict)
         return ProjectService._project_helper(new_project)
 
     @staticmethod
     async def get_all_projects(
-        skip: int = 0, limit: int = 100, status: Optional[str] = None
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        filters: Optional[ProjectQuery] = None,
     ) -> List[dict]:
         """Get all projects with optional filtering and pagination"""
-        db = client_db
-        query = {}
-        if status:
-            query["status"] = status
+        db = get_database()
+        filters = filters or ProjectQuery(status=status)
+
+        projects = await db.projects.list(filters, skip=skip, limit=limit)
+        return [ProjectService._project_helper(p) for p in projects]
 
-        projects = []
-        cursor = db.projects.find(query).skip(skip).limit(limit).sort("created_at", -1)
-        async for project in cursor:
-            projects.append(ProjectService._project_helper(project))
-        return projects
+    @staticmethod
+    async def get_projects_page(
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[ProjectQuery] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Get one keyset page of filtered projects and the next page cursor"""
+        db = get_database()
+        docs, next_cursor = await db.projects.page(filters or ProjectQuery(), limit, cursor)
+        return [ProjectService._project_helper(p) for p in docs], next_cursor
 
     @staticmethod
     async def get_project_by_id(project_id: str) -> Optional[dict]:
         """Get a single project by ID"""
-        db = client_db
-        if not ObjectId.is_valid(project_id):
-            return None
-
-        project = await db.projects.find_one({"_id": ObjectId(project_id)})
+        db = get_database()
+        project = await db.projects.get(project_id)
         if project:
             return ProjectService._project_helper(project)
         return None
@@ -66,19 +85,8 @@ class ProjectService:
         project_id: str, status: ProjectStatus, owner_id: str = None
     ) -> Optional[dict]:
         """Update project status"""
-        db = client_db
-        if not ObjectId.is_valid(project_id):
-            return None
-
-        query = {"_id": ObjectId(project_id)}
-        if owner_id:
-            query["created_by"] = ObjectId(owner_id)
-
-        result = await db.projects.find_one_and_update(
-            query,
-            {"$set": {"status": status}},
-            return_document=True,
-        )
+        db = get_database()
+        result = await db.projects.update(project_id, {"status": status}, owner_id)
 
         if result:
             return ProjectService._project_helper(result)
@@ -89,10 +97,7 @@ class ProjectService:
         project_id: str, project_update: ProjectUpdate, owner_id: str = None
     ) -> Optional[dict]:
         """Update project details"""
-        db = client_db
-        if not ObjectId.is_valid(project_id):
-            return None
-
+        db = get_database()
         update_data = {
             k: v for k, v in project_update.model_dump().items() if v is not None
         }
@@ -100,13 +105,7 @@ class ProjectService:
         if not update_data:
             return await ProjectService.get_project_by_id(project_id)
 
-        query = {"_id": ObjectId(project_id)}
-        if owner_id:
-            query["created_by"] = ObjectId(owner_id)
-
-        result = await db.projects.find_one_and_update(
-            query, {"$set": update_data}, return_document=True
-        )
+        result = await db.projects.update(project_id, update_data, owner_id)
 
         if result:
             return ProjectService._project_helper(result)
@@ -115,13 +114,177 @@ class ProjectService:
     @staticmethod
     async def delete_project(project_id: str, owner_id: str = None) -> bool:
         """Delete a project"""
-        db = client_db
-        if not ObjectId.is_valid(project_id):
-            return False
+        db = get_database()
+        return await db.projects.delete(project_id, owner_id)
+
+
+class CompletionService:
+    @staticmethod
+    async def get_completed_project_ids(
+        user_id: str, project_ids: Optional[Iterable[str]] = None
+    ) -> Set[str]:
+        """Get the IDs of projects a user has completed.
+
+        Pass ``project_ids`` to check one page of projects against the
+        user's cached completion set (no query once it is loaded); omit it
+        to load every completion of the user.
+        """
+        db = get_database()
+        if project_ids is None:
+            return await db.completions.completed_ids(user_id)
+
+        completed = await completion_cache.get(user_id, db.completions.completed_ids)
+        return {i for i in project_ids if i in completed}
+
+    @staticmethod
+    async def is_completed(user_id: str, project_id: str) -> bool:
+        db = get_database()
+        completed = await completion_cache.get(user_id, db.completions.completed_ids)
+        return project_id in completed
+
+    @staticmethod
+    async def mark_completed(user_id: str, project_id: str) -> str:
+        """Record a completion with one upsert and bump the counters.
+
+        Returns "completed", "duplicate" when it already existed (also for
+        the loser of two concurrent submits) or "not_found". The project's
+        counter update doubles as its existence check, so a missing
+        project costs a rollback only on that error path; the user's
+        counter is updated in the background. A duplicate is confirmed
+        against the project, since the row may be another request's
+        upsert for a missing project that is about to be rolled back.
+        """
+        db = get_database()
+        if not await db.completions.add(user_id, project_id, datetime.utcnow()):
+            if not await db.projects.get(project_id, {"_id": 1}):
+                return "not_found"
+            return "duplicate"
+
+        if not await db.projects.add_completion_count([project_id], 1):
+            await db.completions.remove(user_id, project_id)
+            return "not_found"
 
-        query = {"_id": ObjectId(project_id)}
-        if owner_id:
-            query["created_by"] = ObjectId(owner_id)
+        # Cached anonymous bodies carry completion_count
+        project_response_cache.invalidate()
+        completion_cache.added(user_id, project_id)
+        task_queue.enqueue(
+            "users.completed_count", db.users.add_completed_count, [user_id], 1, retry_if=_not_sent
+        )
+        return "completed"
+
+    @staticmethod
+    async def mark_completed_many(user_id: str, project_ids: List[str]) -> List[dict]:
+        """Record a batch of completions with one lookup and one unordered insert.
+
+        Returns one result per input ID, in order, with a status of
+        "completed", "duplicate" (already completed, or repeated in the
+        batch), "not_found" or "invalid".
+        """
+        db = get_database()
+        unique = list(dict.fromkeys(i for i in project_ids if ObjectId.is_valid(i)))
+        existing = {
+            str(p["_id"]) for p in await db.projects.get_many(unique, {"_id": 1})
+        }
+
+        to_add = [i for i in unique if i in existing]
+        duplicates = await db.completions.add_many(user_id, to_add, datetime.utcnow())
+        added = [i for i in to_add if i not in duplicates]
+
+        if added:
+            for project_id in added:
+                completion_cache.added(user_id, project_id)
+            task_queue.enqueue(
+                "projects.completion_count", CompletionService._add_completion_count, added, retry_if=_not_sent
+            )
+            task_queue.enqueue(
+                "users.completed_count", db.users.add_completed_count, [user_id], len(added), retry_if=_not_sent
+            )
+
+        results, seen = [], set()
+        for project_id in project_ids:
+            if not ObjectId.is_valid(project_id):
+                result = "invalid"
+            elif project_id not in existing:
+                result = "not_found"
+            elif project_id in seen or project_id in duplicates:
+                result = "duplicate"
+            else:
+                result = "completed"
+            seen.add(project_id)
+            results.append({"id": project_id, "status": result})
+        return results
+
+    @staticmethod
+    async def _add_completion_count(project_ids: List[str]):
+        await get_database().projects.add_completion_count(project_ids, 1)
+        project_response_cache.invalidate()
+
+    @staticmethod
+    async def remove_project_completions(project_id: str) -> int:
+        """Delete a project's completions and take them off the users' counters.
+
+        Runs on the task queue after a project delete. The counter update
+        is queued as its own job, so a retry of it cannot be skipped by the
+        completions already being gone.
+        """
+        db = get_database()
+        user_ids = await db.completions.delete_for_project(project_id)
+        if user_ids:
+            completion_cache.removed(user_ids, project_id)
+            task_queue.enqueue(
+                "users.completed_count", db.users.add_completed_count, user_ids, -1, retry_if=_not_sent
+            )
+        return len(user_ids)
+
+    @staticmethod
+    async def notify_project_update(project: dict, fields: Iterable[str]) -> int:
+        """Email the users who completed a project that it was edited.
+
+        Runs on the task queue after an edit: one completions read, one
+        users read, and a single render queued for every recipient. The
+        owner, who made the edit, is not notified.
+        """
+        db = get_database()
+        user_ids = [
+            user_id
+            for user_id in await db.completions.user_ids_for_project(str(project["_id"]))
+            if user_id != project.get("created_by")
+        ]
+        if not user_ids:
+            return 0
+        recipients = await db.users.emails(user_ids)
+        summary = ", ".join(field.replace("_", " ") for field in fields) + " changed"
+        return send_project_update_emails(recipients, project, summary)
+
+    @staticmethod
+    async def get_completed_projects(
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        direction: int = -1,
+        projection: Optional[dict] = None,
+    ) -> Tuple[List[Tuple[dict, dict]], Optional[str]]:
+        """Get a user's completions joined with their projects.
+
+        Completions are paged on ``completed_at`` and their projects are
+        fetched with one bulk ``$in`` query, so a page costs two round
+        trips no matter how many completions it holds.
+        """
+        db = get_database()
+        completions, next_cursor = await db.completions.list(
+            user_id, limit, cursor, direction
+        )
+
+        projects = {
+            str(project["_id"]): project
+            for project in await db.projects.get_many(
+                [c["project_id"] for c in completions], projection
+            )
+        }
 
-        result = await db.projects.delete_one(query)
-        return result.deleted_count > 0
\ No newline at end of file
+        pairs = [
+            (completion, projects[completion["project_id"]])
+            for completion in completions
+            if completion["project_id"] in projects
+        ]
+        return pairs, next_cursor
@@ -0,0 +1,358 @@
+"""
+Load-test the HTTP API in process and record per-endpoint latency.
+
+    python -m benchmarks.bench_api [--storage memory|mongo] [--users 50]
+        [--projects 2000] [--requests 2000] [--concurrency 32]
+        [--scenario anonymous_browse ...] [--output results.json]
+        [--compare baseline.json] [--tolerance 0.2] [--bcrypt-rounds 12]
+
+Users, projects and completions are seeded through the API, then each
+scenario is driven with a fixed number of requests at a fixed
+concurrency. Results (throughput and p50/p95/p99 per endpoint) are
+written as JSON; --compare exits non-zero when any p95 got slower than
+the baseline by more than the tolerance.
+
+Login and signup throughput is bound by the bcrypt cost; lower it with
+--bcrypt-rounds to benchmark the rest of the auth path. login_storm_browse
+runs logins and logged-in GET /projects concurrently: compare its
+GET /projects p99 with logged_in_browse to see whether hashing stalls
+the event loop.
+
+--storage mongo uses MONGODB_URL / DATABASE_NAME and writes to that
+database, so point it at a throwaway local server.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from backend.app.core.config import get_settings
+from backend.app.core.jwt_utils import shutdown_password_pool
+from backend.app.core.tasks import task_queue
+from backend.app.main import app
+from database.connection import close_database, get_database, set_database
+from database.memory import InMemoryDatabase
+
+SCENARIOS = ("anonymous_browse", "logged_in_browse", "login_storm", "login_storm_browse", "write_burst")
+PASSWORD = "bench-password"
+PAGE_SIZE = 20
+
+
+class _NoCookies(DefaultCookiePolicy):
+    # Auth responses set a cookie; keep it out of the shared client so
+    # anonymous requests stay anonymous and tokens are sent explicitly
+    def set_ok(self, cookie, request):
+        return False
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Recorder:
+    """Latencies per endpoint for one scenario"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+        return response
+
+    def report(self, elapsed: float) -> dict:
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            values.sort()
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors[endpoint],
+                "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+            }
+        total = sum(len(v) for v in self.latencies.values())
+        return {
+            "elapsed_seconds": elapsed,
+            "requests": total,
+            "throughput_rps": total / elapsed if elapsed else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+# --------------------------------------------------
+# Seeding
+# --------------------------------------------------
+async def gather_limited(concurrency: int, coros):
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(coro):
+        async with slots:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros))
+
+
+async def signup(client: httpx.AsyncClient, email: str) -> dict:
+    response = await client.post("/auth/signup", json={
+        "name": email.split("@")[0],
+        "email": email,
+        "password": PASSWORD,
+    })
+    response.raise_for_status()
+    return {"email": email, "token": response.json()["access_token"]}
+
+
+def auth(user: dict) -> dict:
+    return {"Authorization": f"Bearer {user['token']}"}
+
+
+def project_payload(rng: random.Random, i: int) -> dict:
+    stacks = ["React", "FastAPI", "MongoDB", "Node", "Django", "Vue", "Go", "Rust"]
+    return {
+        "title": f"Project {i} {rng.choice(['dashboard', 'api', 'landing page', 'mobile app'])}",
+        "description": "Build and ship a production ready feature with tests. " * rng.randint(1, 6),
+        "budget": rng.randint(50, 5000),
+        "tech_stack": rng.sample(stacks, rng.randint(1, 4)),
+    }
+
+
+async def create_project(client: httpx.AsyncClient, user: dict, payload: dict) -> str:
+    response = await client.post("/projects", json=payload, headers=auth(user))
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def seed(client: httpx.AsyncClient, args, rng: random.Random) -> dict:
+    users = await gather_limited(args.concurrency, [
+        signup(client, f"user{i}@bench.local") for i in range(args.users)
+    ])
+    project_ids = await gather_limited(args.concurrency, [
+        create_project(client, users[i % len(users)], project_payload(rng, i))
+        for i in range(args.projects)
+    ])
+
+    completions = [
+        client.patch(f"/projects/{project_id}/complete", headers=auth(user))
+        for user in users
+        for project_id in rng.sample(project_ids, min(args.completions, len(project_ids)))
+    ]
+    await gather_limited(args.concurrency, completions)
+    return {"users": users, "project_ids": project_ids}
+
+
+# --------------------------------------------------
+# Scenarios
+# --------------------------------------------------
+async def anonymous_browse(client, rec: Recorder, rng, state, i):
+    if i % 4 == 0:
+        project_id = rng.choice(state["project_ids"])
+        await rec.call(client, "GET /projects/{id}", "GET", f"/projects/{project_id}")
+        return
+
+    # Walk a few feed pages the way the frontend infinite scroll does
+    cursor = None
+    for _ in range(rng.randint(1, 3)):
+        params = {"limit": PAGE_SIZE, "view": "summary"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await rec.call(client, "GET /projects", "GET", "/projects", params=params)
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+
+async def logged_in_browse(client, rec: Recorder, rng, state, i):
+    user = rng.choice(state["users"])
+    step = i % 3
+    if step == 0:
+        await rec.call(client, "GET /projects", "GET", "/projects",
+                       params={"limit": PAGE_SIZE}, headers=auth(user))
+    elif step == 1:
+        project_id = rng.choice(state["project_ids"])
+        await rec.call(client, "GET /projects/{id}", "GET", f"/projects/{project_id}",
+                       headers=auth(user))
+    else:
+        await rec.call(client, "GET /projects/completed/me", "GET", "/projects/completed/me",
+                       params={"limit": PAGE_SIZE}, headers=auth(user))
+
+
+async def login_storm(client, rec: Recorder, rng, state, i):
+    user = rng.choice(state["users"])
+    await rec.call(client, "POST /auth/login", "POST", "/auth/login",
+                   json={"email": user["email"], "password": PASSWORD})
+
+
+async def login_storm_browse(client, rec: Recorder, rng, state, i):
+    # Logins and feed reads interleaved on the same workers, so the GET
+    # /projects percentiles show what a login burst costs everyone else
+    if i % 2 == 0:
+        await login_storm(client, rec, rng, state, i)
+        return
+    user = rng.choice(state["users"])
+    await rec.call(client, "GET /projects", "GET", "/projects",
+                   params={"limit": PAGE_SIZE}, headers=auth(user))
+
+
+async def write_burst(client, rec: Recorder, rng, state, i):
+    step = i % 4
+    if step == 0:
+        email = f"burst{state['run']}-{i}@bench.local"
+        response = await rec.call(client, "POST /auth/signup", "POST", "/auth/signup",
+                                  json={"name": "burst", "email": email, "password": PASSWORD})
+        if response.status_code == 200:
+            state["users"].append({"email": email, "token": response.json()["access_token"]})
+    elif step == 3:
+        user = rng.choice(state["users"])
+        project_id = rng.choice(state["project_ids"])
+        await rec.call(client, "PATCH /projects/{id}/complete", "PATCH",
+                       f"/projects/{project_id}/complete", headers=auth(user))
+    else:
+        user = rng.choice(state["users"])
+        response = await rec.call(client, "POST /projects", "POST", "/projects",
+                                  json=project_payload(rng, i), headers=auth(user))
+        if response.status_code == 200:
+            state["project_ids"].append(response.json()["id"])
+
+
+async def run_scenario(client, name: str, args, rng, state) -> dict:
+    step = globals()[name]
+    rec = Recorder()
+    counter = iter(range(args.requests))
+
+    async def worker():
+        for i in counter:
+            await step(client, rec, rng, state, i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return rec.report(time.perf_counter() - started)
+
+
+# --------------------------------------------------
+# Reporting
+# --------------------------------------------------
+def print_report(results: dict):
+    for name, scenario in results["scenarios"].items():
+        print(f"\n{name}: {scenario['requests']} requests, "
+              f"{scenario['throughput_rps']:.0f} req/s")
+        for endpoint, s in scenario["endpoints"].items():
+            print(f"  {endpoint:32} {s['throughput_rps']:8.0f} req/s  "
+                  f"p50 {s['p50_ms']:7.2f}  p95 {s['p95_ms']:7.2f}  "
+                  f"p99 {s['p99_ms']:7.2f} ms  errors {s['errors']}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> int:
+    """Print p95 changes against a baseline run and count regressions"""
+    regressions = 0
+    print(f"\nCompared with baseline from {baseline.get('started_at')}:")
+    for name, scenario in results["scenarios"].items():
+        old_scenario = baseline.get("scenarios", {}).get(name, {})
+        for endpoint, s in scenario["endpoints"].items():
+            old = old_scenario.get("endpoints", {}).get(endpoint)
+            if not old or not old["p95_ms"]:
+                continue
+            change = s["p95_ms"] / old["p95_ms"] - 1
+            flag = ""
+            if change > tolerance:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"  {name:18} {endpoint:32} p95 {old['p95_ms']:7.2f} -> "
+                  f"{s['p95_ms']:7.2f} ms ({change:+.0%}){flag}")
+    return regressions
+
+
+async def run(args) -> dict:
+    if args.bcrypt_rounds:
+        get_settings().BCRYPT_ROUNDS = args.bcrypt_rounds
+    if args.storage == "memory":
+        set_database(InMemoryDatabase())
+    database = get_database()
+    await database.warm_up()
+    await database.init()
+
+    rng = random.Random(args.seed)
+    transport = httpx.ASGITransport(app=app)
+    cookies = CookieJar(policy=_NoCookies())
+
+    results = {
+        "started_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "bcrypt_rounds": get_settings().BCRYPT_ROUNDS,
+        "config": vars(args),
+        "scenarios": {},
+    }
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+            started = time.perf_counter()
+            state = await seed(client, args, rng)
+            results["seed_seconds"] = time.perf_counter() - started
+
+            for run_number, name in enumerate(args.scenario):
+                state["run"] = run_number
+                results["scenarios"][name] = await run_scenario(client, name, args, rng, state)
+    finally:
+        await task_queue.drain()
+        shutdown_password_pool()
+        close_database()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--storage", choices=("memory", "mongo"), default="memory")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=2000)
+    parser.add_argument("--completions", type=int, default=10, help="completions per seeded user")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--bcrypt-rounds", type=int, help="override BCRYPT_ROUNDS for seeded users")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON results file")
+    parser.add_argument("--compare", help="baseline JSON results to compare p95 against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+    args.scenario = args.scenario or list(SCENARIOS)
+
+    results = asyncio.run(run(args))
+    print(f"Seeded {args.users} users, {args.projects} projects in {results['seed_seconds']:.1f} s")
+    print_report(results)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
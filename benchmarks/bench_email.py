@@ -0,0 +1,170 @@
+"""
+Measure email throughput against a local stand-in SMTP server.
+
+    python -m benchmarks.bench_email [--messages 2000] [--pool-size 2]
+        [--batch-size 50] [--latency-ms 2] [--output results.json]
+
+Starts a minimal SMTP server on 127.0.0.1 that accepts every message,
+optionally delaying each reply by --latency-ms to mimic a remote relay,
+then sends the same password reset emails two ways:
+
+  per_message  a new connection (and handshake) per email, as the old
+               email helper did
+  pooled       the EmailService: queued, batched, persistent connections
+
+and reports messages per second and connections opened for each.
+"""
+import argparse
+import asyncio
+import json
+import os
+import smtplib
+import threading
+import time
+
+from backend.app.services.email_service import (
+    EmailService,
+    SMTPPool,
+    build_message,
+    render_template,
+)
+
+
+class StandInSMTPServer:
+    """Accepts and counts SMTP messages on a background thread"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.messages = 0
+        self.connections = 0
+        self.port = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="smtp-stand-in", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        server.close()
+
+    async def _reply(self, writer, line: str):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        writer.write(line.encode() + b"\r\n")
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        await self._reply(writer, "220 stand-in ESMTP")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line[:4].decode(errors="replace").upper()
+                if command == "EHLO":
+                    await self._reply(writer, "250-stand-in\r\n250 8BITMIME")
+                elif command == "DATA":
+                    await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b""):
+                        pass
+                    self.messages += 1
+                    await self._reply(writer, "250 OK")
+                elif command == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    break
+                else:
+                    # HELO, MAIL, RCPT, RSET, NOOP
+                    await self._reply(writer, "250 OK")
+        finally:
+            writer.close()
+
+
+def make_messages(count: int):
+    subject, text, html_body = render_template(
+        "password_reset", reset_url="http://localhost/reset-password?token=x", expires_hours=24
+    )
+    return [build_message(f"user{i}@example.com", subject, text, html_body) for i in range(count)]
+
+
+def run_per_message(server: StandInSMTPServer, messages) -> dict:
+    started = time.perf_counter()
+    for message in messages:
+        conn = smtplib.SMTP("127.0.0.1", server.port)
+        conn.send_message(message)
+        conn.quit()
+    return {"seconds": time.perf_counter() - started}
+
+
+async def run_pooled(server: StandInSMTPServer, messages, args) -> dict:
+    service = EmailService(
+        SMTPPool("127.0.0.1", server.port, starttls=False),
+        pool_size=args.pool_size,
+        batch_size=args.batch_size,
+        batch_wait_ms=args.batch_wait_ms,
+        max_queue=len(messages),
+    )
+    started = time.perf_counter()
+    for message in messages:
+        service.send(message)
+    await service.drain()
+    result = {"seconds": time.perf_counter() - started}
+    result.update(service.stats())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--batch-wait-ms", type=float, default=50)
+    parser.add_argument("--latency-ms", type=float, default=2, help="delay before each server reply")
+    parser.add_argument("--output", help="JSON results file")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    results = {"config": vars(args), "scenarios": {}}
+
+    for name in ("per_message", "pooled"):
+        server = StandInSMTPServer(latency=args.latency_ms / 1000).start()
+        try:
+            if name == "per_message":
+                result = run_per_message(server, messages)
+            else:
+                result = asyncio.run(run_pooled(server, messages, args))
+        finally:
+            server.stop()
+        result["delivered"] = server.messages
+        result["server_connections"] = server.connections
+        result["throughput"] = server.messages / result["seconds"]
+        results["scenarios"][name] = result
+
+    print(f"{'scenario':<14}{'delivered':>10}{'connections':>13}{'seconds':>10}{'msg/s':>10}")
+    for name, r in results["scenarios"].items():
+        print(f"{name:<14}{r['delivered']:>10}{r['server_connections']:>13}"
+              f"{r['seconds']:>10.2f}{r['throughput']:>10.1f}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare project feed serialization paths on a synthetic catalog.
+
+    python -m benchmarks.bench_serialization [--projects 10000] [--repeat 5]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from backend.app.services.serializers import serialize_project
+
+
+def make_projects(count: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Project {i}",
+            "description": "Build a responsive dashboard with auth. " * 8,
+            "budget": 100 + i,
+            "tech_stack": ["React", "FastAPI", "MongoDB"],
+            "status": "OPEN",
+            "created_by": str(ObjectId()),
+            "created_at": now - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_path(docs: list) -> bytes:
+    """Inline dict building + jsonable_encoder + stdlib json"""
+    projects = []
+    for p in docs:
+        projects.append({
+            "id": str(p["_id"]),
+            "title": p.get("title"),
+            "description": p.get("description"),
+            "budget": p.get("budget"),
+            "tech_stack": p.get("tech_stack", []),
+            "status": p.get("status", "OPEN"),
+            "created_by": p.get("created_by"),
+            "created_at": (
+                p["created_at"].isoformat()
+                if p.get("created_at") else None
+            ),
+            "isCompleted": False,
+        })
+    return JSONResponse(jsonable_encoder(projects)).body
+
+
+def fast_path(docs: list) -> bytes:
+    """serialize_project + orjson, skipping jsonable_encoder"""
+    projects = [serialize_project(p, is_completed=False) for p in docs]
+    return ORJSONResponse(projects).body
+
+
+def best_of(func, docs: list, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(docs)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    docs = make_projects(args.projects)
+    legacy = best_of(legacy_path, docs, args.repeat)
+    fast = best_of(fast_path, docs, args.repeat)
+
+    print(f"{args.projects} projects, best of {args.repeat}")
+    print(f"  jsonable_encoder + json   : {legacy * 1000:8.1f} ms")
+    print(f"  serialize_project + orjson: {fast * 1000:8.1f} ms")
+    print(f"  speedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
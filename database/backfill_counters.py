@@ -0,0 +1,57 @@
+# Usage: python -m database.backfill_counters
+# Recomputes projects.completion_count and users.completed_count from
+# project_completions. Run once after deploying the counters; safe to re-run.
+import asyncio
+import sys
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from database.connection import get_database, close_database
+
+
+async def completion_counts(completions, group_field: str) -> dict:
+    """Count completions per user_id or project_id"""
+    counts = {}
+    pipeline = [{"$group": {"_id": f"${group_field}", "count": {"$sum": 1}}}]
+    async for row in completions.aggregate(pipeline):
+        if ObjectId.is_valid(row["_id"]):
+            counts[ObjectId(row["_id"])] = row["count"]
+    return counts
+
+
+async def backfill(collection, field: str, counts: dict) -> int:
+    """Set field from counts, and to 0 on every other document"""
+    updates = [
+        UpdateOne({"_id": oid}, {"$set": {field: count}})
+        for oid, count in counts.items()
+    ]
+    updated = 0
+    if updates:
+        result = await collection.bulk_write(updates, ordered=False)
+        updated += result.modified_count
+
+    result = await collection.update_many(
+        {"_id": {"$nin": list(counts)}, field: {"$ne": 0}},
+        {"$set": {field: 0}},
+    )
+    return updated + result.modified_count
+
+
+async def main():
+    db = get_database().db
+    completions = db["project_completions"]
+
+    project_counts = await completion_counts(completions, "project_id")
+    updated = await backfill(db["projects"], "completion_count", project_counts)
+    print(f"projects: {updated} updated")
+
+    user_counts = await completion_counts(completions, "user_id")
+    updated = await backfill(db["users"], "completed_count", user_counts)
+    print(f"users: {updated} updated")
+
+    close_database()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
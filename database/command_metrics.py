@@ -0,0 +1,77 @@
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+from pymongo import monitoring
+
+
+class QueryStats:
+    """Mongo commands issued while serving one request"""
+
+    __slots__ = ("count", "seconds", "_lock")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+
+
+# Set by the metrics middleware for the duration of a request. Motor copies
+# the context into its executor threads, so the listener below sees it.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Command listener counting Mongo operations and their time.
+
+    Totals are kept per command name; commands issued inside a request
+    are also added to that request's QueryStats.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.commands = {}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: dict(stats) for name, stats in self.commands.items()}
+
+    def _record(self, event, failed: bool):
+        seconds = event.duration_micros / 1_000_000
+        with self._lock:
+            stats = self.commands.get(event.command_name)
+            if stats is None:
+                stats = self.commands[event.command_name] = {
+                    "count": 0, "failures": 0, "seconds": 0.0,
+                }
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            if failed:
+                stats["failures"] += 1
+
+        request_stats = current_query_stats.get()
+        if request_stats is not None:
+            request_stats.add(seconds)
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event, failed=False)
+
+    def failed(self, event):
+        self._record(event, failed=True)
+
+
+command_metrics = CommandMetrics()
@@ -1,30 +1,142 @@
-import os
-from dotenv import load_dotenv
+import asyncio
+import time
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 
-load_dotenv()
+from backend.app.core.config import Settings, get_settings
+from database.indexes import reconcile_indexes
+from database.command_metrics import command_metrics
+from database.pool_metrics import pool_metrics
+from database.repositories import (
+    MotorCompletionRepository,
+    MotorProjectRepository,
+    MotorUserRepository,
+)
 
-# --------------------------------------------------
-# Environment Variables
-# --------------------------------------------------
-MONGO_URL = os.getenv("MONGODB_URL", "").strip()
-DATABASE_NAME = os.getenv("DATABASE_NAME", "").strip()
-
-if not MONGO_URL or not DATABASE_NAME:
-    raise RuntimeError("MongoDB environment variables not set")
 
 # --------------------------------------------------
 # MongoDB Client
 # --------------------------------------------------
-client = AsyncIOMotorClient(MONGO_URL)
-db = client[DATABASE_NAME]
+class Database:
+    """Motor client and the app's repositories.
+
+    Creating one does not connect; Motor opens connections on first use.
+    """
+
+    def __init__(self, settings: Settings):
+        if not settings.MONGODB_URL or not settings.DATABASE_NAME:
+            raise RuntimeError("MongoDB environment variables not set")
+
+        self.settings = settings
+        self.client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            event_listeners=[pool_metrics, command_metrics],
+            **settings.MONGO_POOL_OPTIONS,
+        )
+        self.db = self.client[settings.DATABASE_NAME]
+
+        # Repositories
+        self.users = MotorUserRepository(self.db["users"])
+        self.projects = MotorProjectRepository(self.db["projects"])
+        self.completions = MotorCompletionRepository(self.db["project_completions"])
+
+    async def init(self):
+        """
+        Reconcile indexes with the registry in database/indexes.py.
+        Call this once on app startup.
+        """
+        try:
+            report = await reconcile_indexes(
+                self.db, drop_extra=self.settings.INDEX_DROP_EXTRA
+            )
+
+            for name, result in report.items():
+                if result["created"]:
+                    print(f"Created indexes on {name}: {', '.join(result['created'])}")
+                if result["dropped"]:
+                    print(f"Dropped indexes on {name}: {', '.join(result['dropped'])}")
+                elif result["extra"]:
+                    print(f"Unregistered indexes on {name}: {', '.join(result['extra'])}")
+
+            print("MongoDB indexes created successfully")
+
+        except Exception as e:
+            print(f"Error creating MongoDB indexes: {e}")
+
+    async def warm_up(self):
+        """Open MONGO_WARMUP_CONNECTIONS pooled connections with concurrent pings"""
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                self.client.admin.command("ping")
+                for _ in range(max(1, self.settings.MONGO_WARMUP_CONNECTIONS))
+            ))
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"MongoDB pool warmed up ({pool_metrics.open} connections, {elapsed:.0f} ms)")
+        except Exception as e:
+            print(f"Error warming up MongoDB pool: {e}")
+
+    def close(self):
+        self.client.close()
+
 
 # --------------------------------------------------
-# Collections
+# Provider
 # --------------------------------------------------
-users_collection = db["users"]
-projects_collection = db["projects"]
-project_completions = db["project_completions"]
+_database: Optional[Database] = None
+
+
+def create_database(settings: Settings):
+    """Build the database for STORAGE_BACKEND ("mongo" or "memory")"""
+    if settings.STORAGE_BACKEND == "memory":
+        from database.memory import InMemoryDatabase
+        return InMemoryDatabase()
+    if settings.STORAGE_BACKEND != "mongo":
+        raise RuntimeError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+    return Database(settings)
+
+
+def get_database() -> Database:
+    """Return the app-wide database, creating it on first use"""
+    global _database
+    if _database is None:
+        _database = create_database(get_settings())
+    return _database
+
+
+def set_database(database: Optional[Database]):
+    """Swap the app-wide database (tests, benchmarks); None resets it"""
+    global _database
+    _database = database
+
+
+def close_database():
+    global _database
+    if _database is not None:
+        _database.close()
+        _database = None
+
+
+# Legacy module attributes (raw Motor objects), resolved lazily so importing
+# stays side-effect free
+_LEGACY_COLLECTIONS = {
+    "users_collection": "users",
+    "projects_collection": "projects",
+    "project_completions": "project_completions",
+}
+
+
+def __getattr__(name):
+    if name in ("client", "db"):
+        return getattr(get_database(), name)
+    if name in _LEGACY_COLLECTIONS:
+        return get_database().db[_LEGACY_COLLECTIONS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def init_database():
+    await get_database().init()
+
 
 # --------------------------------------------------
 # MongoDB Schema Documentation
@@ -59,29 +171,3 @@ PROJECT_COMPLETIONS COLLECTION:
     "completed_at": datetime
 }
 """
-
-# --------------------------------------------------
-# Database Initialization (Indexes)
-# --------------------------------------------------
-async def init_database():
-    """
-    Initialize database with required indexes.
-    Call this once on app startup.
-    """
-    try:
-        # Unique email for users
-        await users_collection.create_index(
-            "email",
-            unique=True
-        )
-
-        # One completion per user per project
-        await project_completions.create_index(
-            [("user_id", 1), ("project_id", 1)],
-            unique=True
-        )
-
-        print("MongoDB indexes created successfully")
-
-    except Exception as e:
-        print(f"Error creating MongoDB indexes: {e}")
@@ -0,0 +1,64 @@
+# Usage: python -m database.explain_indexes [--reconcile]
+# Exits non-zero when any registered query shape needs a COLLSCAN.
+import asyncio
+import sys
+
+from database.connection import get_database, close_database
+from database.indexes import QUERY_SHAPES, reconcile_indexes
+
+
+def plan_stages(plan) -> list:
+    """Collect every stage name in an explain() plan tree"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(plan_stages(item))
+    return stages
+
+
+async def explain_shapes(db) -> int:
+    """Explain every registered query shape and count collection scans"""
+    collscans = 0
+    for shape in QUERY_SHAPES:
+        cursor = db[shape["collection"]].find(shape["filter"])
+        if shape.get("sort"):
+            cursor = cursor.sort(shape["sort"])
+        if shape.get("limit"):
+            cursor = cursor.limit(shape["limit"])
+
+        explain = await cursor.explain()
+        stages = plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+
+        flag = "OK"
+        if "COLLSCAN" in stages:
+            flag = "COLLSCAN"
+            collscans += 1
+
+        print(f"  [{flag:8}] {shape['collection']}: {shape['name']}")
+        print(f"             {' <- '.join(stages)}")
+
+    return collscans
+
+
+async def main():
+    db = get_database().db
+
+    if '--reconcile' in sys.argv:
+        report = await reconcile_indexes(db)
+        for name, result in report.items():
+            print(f"{name}: created {result['created'] or 'none'}, extra {result['extra'] or 'none'}")
+
+    print('\nQuery plans:')
+    collscans = await explain_shapes(db)
+    print(f'\n{collscans} query shape(s) use a collection scan\n')
+
+    close_database()
+    return 1 if collscans else 0
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
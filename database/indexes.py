@@ -0,0 +1,108 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+
+# --------------------------------------------------
+# Index Registry
+# --------------------------------------------------
+# Every index the API relies on, per collection. init_database reconciles
+# the live collections against this registry on startup.
+INDEXES = {
+    "users": [
+        # Login / signup lookups; one account per email
+        IndexModel([("email", ASCENDING)], unique=True),
+    ],
+    "projects": [
+        # Feed, newest first (keyset on created_at, _id)
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Feed filtered by status
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # "My projects" and owner filter
+        IndexModel([("created_by", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Budget ranges and sort=budget
+        IndexModel([("budget", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("budget", ASCENDING), ("_id", ASCENDING)]),
+        # Tech-stack filters (multikey), newest first
+        IndexModel([("tech_stack", ASCENDING), ("created_at", DESCENDING)]),
+        # Keyword search over titles (weighted) and descriptions
+        IndexModel(
+            [("title", TEXT), ("description", TEXT)],
+            weights={"title": 3, "description": 1},
+            name="project_text",
+        ),
+    ],
+    "project_completions": [
+        # One completion per user per project; covers completion-set lookups
+        IndexModel([("user_id", ASCENDING), ("project_id", ASCENDING)], unique=True),
+        # A user's completions by completion time (keyset)
+        IndexModel([("user_id", ASCENDING), ("completed_at", DESCENDING), ("_id", DESCENDING)]),
+        # Delete cascade when a project is removed
+        IndexModel([("project_id", ASCENDING)]),
+    ],
+}
+
+
+# --------------------------------------------------
+# Query Shapes
+# --------------------------------------------------
+# One entry per query the handlers issue, used by explain_indexes.py to
+# check that each is served by an index. Values are placeholders; only
+# the shape matters to the planner.
+_ID = "000000000000000000000000"
+
+QUERY_SHAPES = [
+    {"name": "user by email", "collection": "users",
+     "filter": {"email": "user@example.com"}},
+    {"name": "project feed", "collection": "projects",
+     "filter": {}, "sort": [("created_at", -1), ("_id", -1)], "limit": 20},
+    {"name": "project feed by status", "collection": "projects",
+     "filter": {"status": "OPEN"}, "sort": [("created_at", -1), ("_id", -1)], "limit": 20},
+    {"name": "projects by owner", "collection": "projects",
+     "filter": {"created_by": _ID}, "sort": [("created_at", -1)]},
+    {"name": "projects by budget", "collection": "projects",
+     "filter": {"budget": {"$gte": 100, "$lte": 500}}, "sort": [("budget", 1), ("_id", 1)], "limit": 20},
+    {"name": "projects by status and budget", "collection": "projects",
+     "filter": {"status": "OPEN"}, "sort": [("budget", 1), ("_id", 1)], "limit": 20},
+    {"name": "projects by tech stack", "collection": "projects",
+     "filter": {"tech_stack": {"$in": ["React"]}}},
+    {"name": "project keyword search", "collection": "projects",
+     "filter": {"$text": {"$search": "react"}}},
+    {"name": "completion exists", "collection": "project_completions",
+     "filter": {"user_id": _ID, "project_id": _ID}},
+    {"name": "completion set for a page", "collection": "project_completions",
+     "filter": {"user_id": _ID, "project_id": {"$in": [_ID]}}},
+    {"name": "completions by time", "collection": "project_completions",
+     "filter": {"user_id": _ID}, "sort": [("completed_at", -1), ("_id", -1)], "limit": 20},
+    {"name": "completion cascade", "collection": "project_completions",
+     "filter": {"project_id": _ID}},
+]
+
+
+async def reconcile_indexes(db, drop_extra: bool = False) -> dict:
+    """Create registered indexes that are missing and report unregistered ones.
+
+    Unregistered indexes are only dropped when ``drop_extra`` is set, so a
+    manually added index is never removed by accident.
+    """
+    report = {}
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        wanted = {model.document["name"]: model for model in models}
+
+        existing = set()
+        async for index in collection.list_indexes():
+            existing.add(index["name"])
+
+        missing = [wanted[name] for name in wanted if name not in existing]
+        extra = sorted(existing - set(wanted) - {"_id_"})
+
+        if missing:
+            await collection.create_indexes(missing)
+        if drop_extra:
+            for name in extra:
+                await collection.drop_index(name)
+
+        report[collection_name] = {
+            "created": [m.document["name"] for m in missing],
+            "extra": extra,
+            "dropped": extra if drop_extra else [],
+        }
+    return report
@@ -0,0 +1,373 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from backend.app.core.pagination import decode_cursor, encode_cursor
+from backend.app.services.project_query import SORT_FIELDS, ProjectQuery
+from backend.app.services.search import InvertedIndex
+from database.repositories import CompletionRepository, ProjectRepository, UserRepository
+
+
+def _stored(doc: dict) -> dict:
+    """Copy of doc as Mongo would store it: BSON dates keep milliseconds only"""
+    return {
+        k: v.replace(microsecond=v.microsecond // 1000 * 1000) if isinstance(v, datetime) else v
+        for k, v in doc.items()
+    }
+
+
+def _sort_key(value, oid: ObjectId) -> tuple:
+    # Missing values sort first, as null does in Mongo
+    return (0, 0, oid) if value is None else (1, value, oid)
+
+
+def _matches(project: dict, filters: ProjectQuery) -> bool:
+    """Evaluate a ProjectQuery against one document"""
+    if filters.status and project.get("status") != filters.status:
+        return False
+    if filters.created_by and project.get("created_by") != filters.created_by:
+        return False
+    if filters.tech_stack:
+        stack = set(project.get("tech_stack") or [])
+        if filters.tech_match == "all":
+            if not stack.issuperset(filters.tech_stack):
+                return False
+        elif not stack.intersection(filters.tech_stack):
+            return False
+
+    budget = project.get("budget")
+    if filters.budget_min is not None and (budget is None or budget < filters.budget_min):
+        return False
+    if filters.budget_max is not None and (budget is None or budget > filters.budget_max):
+        return False
+
+    created_at = project.get("created_at")
+    if filters.created_after is not None and (created_at is None or created_at < filters.created_after):
+        return False
+    if filters.created_before is not None and (created_at is None or created_at >= filters.created_before):
+        return False
+    return True
+
+
+def _keyset_slice(keys: List[tuple], cursor_key: Optional[tuple], direction: int) -> Iterable[tuple]:
+    """Keys strictly after the cursor position in the given direction"""
+    if direction < 0:
+        end = bisect_left(keys, cursor_key) if cursor_key else len(keys)
+        return reversed(keys[:end])
+    start = bisect_right(keys, cursor_key) if cursor_key else 0
+    return keys[start:]
+
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._by_email: Dict[str, str] = {}
+
+    async def get(self, user_id: str) -> Optional[dict]:
+        user = self._docs.get(user_id)
+        return dict(user) if user else None
+
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        user_id = self._by_email.get(email)
+        return dict(self._docs[user_id]) if user_id else None
+
+    async def create(self, user: dict) -> str:
+        if user["email"] in self._by_email:
+            raise DuplicateKeyError("E11000 duplicate key error: email")
+        user.setdefault("_id", ObjectId())
+        user_id = str(user["_id"])
+        self._docs[user_id] = _stored(user)
+        self._by_email[user["email"]] = user_id
+        return user_id
+
+    async def list_all(self) -> List[dict]:
+        return [dict(u) for u in self._docs.values()]
+
+    async def emails(self, user_ids: Iterable[str]) -> List[str]:
+        return [self._docs[i]["email"] for i in user_ids if i in self._docs]
+
+    async def add_completed_count(self, user_ids: Iterable[str], delta: int) -> None:
+        for user_id in user_ids:
+            user = self._docs.get(user_id)
+            if user is not None:
+                user["completed_count"] = user.get("completed_count", 0) + delta
+
+    async def replace_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        user = self._docs.get(user_id)
+        if user is None or user.get("password_hash") != old_hash:
+            return False
+        user["password_hash"] = new_hash
+        return True
+
+
+class InMemoryProjectRepository(ProjectRepository):
+    """Projects in a dict, with the same secondary indexes as Mongo.
+
+    Each sort field keeps a sorted list of (value, _id) keys so keyset
+    pages are a bisect plus a short walk; status and owner lookups use
+    hash indexes. Projections are not applied: documents are returned
+    whole and the serializers trim them.
+    """
+
+    def __init__(self):
+        self._docs: Dict[str, dict] = {}
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_owner: Dict[str, Set[str]] = defaultdict(set)
+        self._sorted: Dict[str, List[tuple]] = {field: [] for field in SORT_FIELDS}
+        self._search = InvertedIndex()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # Index maintenance
+    def _index(self, project: dict):
+        project_id = str(project["_id"])
+        self._docs[project_id] = project
+        self._by_status[project.get("status")].add(project_id)
+        self._by_owner[project.get("created_by")].add(project_id)
+        for field, keys in self._sorted.items():
+            insort(keys, _sort_key(project.get(field), project["_id"]))
+        self._search.add(project)
+
+    def _unindex(self, project_id: str) -> Optional[dict]:
+        project = self._docs.pop(project_id, None)
+        if project is None:
+            return None
+        self._by_status[project.get("status")].discard(project_id)
+        self._by_owner[project.get("created_by")].discard(project_id)
+        for field, keys in self._sorted.items():
+            key = _sort_key(project.get(field), project["_id"])
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        self._search.remove(project_id)
+        return project
+
+    def _candidates(self, filters: ProjectQuery) -> Optional[Set[str]]:
+        sets = []
+        if filters.status:
+            sets.append(self._by_status.get(filters.status, set()))
+        if filters.created_by:
+            sets.append(self._by_owner.get(filters.created_by, set()))
+        if not sets:
+            return None
+        return set.intersection(*sets)
+
+    def _walk(self, filters: ProjectQuery, cursor: Optional[str]) -> Iterable[dict]:
+        """Yield matching documents in sort order, after the cursor if given"""
+        field, direction = filters.sort_field, filters.direction
+
+        cursor_key = None
+        if cursor:
+            value, oid = decode_cursor(cursor, field)
+            cursor_key = _sort_key(value, oid)
+
+        candidates = self._candidates(filters)
+        if candidates is not None and len(candidates) * 8 < len(self._docs):
+            # Selective equality filter: sort the few candidates instead
+            keys = sorted(
+                _sort_key(self._docs[i].get(field), self._docs[i]["_id"])
+                for i in candidates
+            )
+        else:
+            keys = self._sorted[field]
+
+        for key in _keyset_slice(keys, cursor_key, direction):
+            project = self._docs[str(key[2])]
+            if _matches(project, filters):
+                yield project
+
+    # Reads
+    async def get(self, project_id: str, projection: Optional[dict] = None) -> Optional[dict]:
+        project = self._docs.get(project_id)
+        return dict(project) if project else None
+
+    async def get_many(self, project_ids: Iterable[str], projection: Optional[dict] = None) -> List[dict]:
+        return [dict(self._docs[i]) for i in project_ids if i in self._docs]
+
+    async def list(
+        self,
+        filters: ProjectQuery,
+        projection: Optional[dict] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        results = []
+        for i, project in enumerate(self._walk(filters, None)):
+            if i < skip:
+                continue
+            results.append(dict(project))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    async def page(
+        self,
+        filters: ProjectQuery,
+        limit: int,
+        cursor: Optional[str] = None,
+        projection: Optional[dict] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        docs = []
+        for project in self._walk(filters, cursor):
+            docs.append(dict(project))
+            if len(docs) > limit:
+                break
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            next_cursor = encode_cursor(last.get(filters.sort_field), last["_id"], filters.sort_field)
+        return docs, next_cursor
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        for project_id in sorted(self._docs):
+            project = self._docs.get(project_id)
+            if project is not None:
+                yield dict(project)
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        tech_stack: Optional[List[str]] = None,
+        match_all: bool = False,
+        budget_min: Optional[int] = None,
+        budget_max: Optional[int] = None,
+        limit: int = 20,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        found = self._search.search(query, tech_stack, match_all, budget_min, budget_max, limit)
+        return [dict(p) for p in found]
+
+    # Writes
+    async def create(self, project: dict) -> dict:
+        project.setdefault("_id", ObjectId())
+        self._index(_stored(project))
+        return project
+
+    async def create_many(self, projects: List[dict]) -> Dict[int, str]:
+        for project in projects:
+            await self.create(project)
+        return {}
+
+    async def update(self, project_id: str, fields: dict, owner_id: Optional[str] = None) -> Optional[dict]:
+        project = self._docs.get(project_id)
+        if project is None or (owner_id and project.get("created_by") != owner_id):
+            return None
+        self._unindex(project_id)
+        updated = _stored({**project, **fields})
+        self._index(updated)
+        return dict(updated)
+
+    async def delete(self, project_id: str, owner_id: Optional[str] = None) -> bool:
+        project = self._docs.get(project_id)
+        if project is None or (owner_id and project.get("created_by") != owner_id):
+            return False
+        self._unindex(project_id)
+        return True
+
+    async def add_completion_count(self, project_ids: Iterable[str], delta: int) -> int:
+        # Not an indexed field, so the stored documents are updated in place
+        matched = 0
+        for project_id in project_ids:
+            project = self._docs.get(project_id)
+            if project is not None:
+                project["completion_count"] = project.get("completion_count", 0) + delta
+                matched += 1
+        return matched
+
+
+class InMemoryCompletionRepository(CompletionRepository):
+    def __init__(self):
+        self._by_user: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        self._by_project: Dict[str, Set[str]] = defaultdict(set)
+
+    async def completed_ids(self, user_id: str, project_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        completed = self._by_user.get(user_id, {})
+        if project_ids is None:
+            return set(completed)
+        return {i for i in project_ids if i in completed}
+
+    async def add(self, user_id: str, project_id: str, completed_at: datetime) -> bool:
+        if project_id in self._by_user.get(user_id, {}):
+            return False
+        self._by_user[user_id][project_id] = _stored({
+            "_id": ObjectId(),
+            "user_id": user_id,
+            "project_id": project_id,
+            "completed_at": completed_at,
+        })
+        self._by_project[project_id].add(user_id)
+        return True
+
+    async def remove(self, user_id: str, project_id: str) -> bool:
+        if self._by_user.get(user_id, {}).pop(project_id, None) is None:
+            return False
+        self._by_project.get(project_id, set()).discard(user_id)
+        return True
+
+    async def add_many(self, user_id: str, project_ids: List[str], completed_at: datetime) -> Set[str]:
+        duplicates = set()
+        for project_id in project_ids:
+            if not await self.add(user_id, project_id, completed_at):
+                duplicates.add(project_id)
+        return duplicates
+
+    async def list(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        direction: int = -1,
+    ) -> Tuple[List[dict], Optional[str]]:
+        completions = self._by_user.get(user_id, {})
+        by_key = {
+            _sort_key(c.get("completed_at"), c["_id"]): c
+            for c in completions.values()
+        }
+        keys = sorted(by_key)
+
+        cursor_key = None
+        if cursor:
+            value, oid = decode_cursor(cursor, "completed_at")
+            cursor_key = _sort_key(value, oid)
+
+        docs = [dict(by_key[k]) for k in _keyset_slice(keys, cursor_key, direction)]
+        if not limit or len(docs) <= limit:
+            return docs, None
+
+        docs = docs[:limit]
+        last = docs[-1]
+        return docs, encode_cursor(last.get("completed_at"), last["_id"], "completed_at")
+
+    async def user_ids_for_project(self, project_id: str) -> List[str]:
+        return list(self._by_project.get(project_id, ()))
+
+    async def delete_for_project(self, project_id: str) -> List[str]:
+        user_ids = self._by_project.pop(project_id, set())
+        for user_id in user_ids:
+            self._by_user.get(user_id, {}).pop(project_id, None)
+        return list(user_ids)
+
+
+class InMemoryDatabase:
+    """Dict-backed stand-in for Database, for benchmarks and offline runs"""
+
+    def __init__(self):
+        self.users = InMemoryUserRepository()
+        self.projects = InMemoryProjectRepository()
+        self.completions = InMemoryCompletionRepository()
+
+    async def init(self):
+        pass
+
+    async def warm_up(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,446 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from backend.app.core.pagination import fetch_keyset_page
+from backend.app.services.project_query import ProjectQuery
+from backend.app.services.search import project_search
+
+
+def _object_id(value: str) -> Optional[ObjectId]:
+    return ObjectId(value) if ObjectId.is_valid(value) else None
+
+
+# --------------------------------------------------
+# Repository Interfaces
+# --------------------------------------------------
+# IDs are passed in as strings; documents come back with an ObjectId "_id"
+# exactly as stored in Mongo, so serializers work with either backend.
+class UserRepository(ABC):
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[dict]:
+        """Get a user by ID; None for unknown or malformed IDs"""
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        """Get a user by email"""
+
+    @abstractmethod
+    async def create(self, user: dict) -> str:
+        """Insert a user and return its ID"""
+
+    @abstractmethod
+    async def list_all(self) -> List[dict]:
+        """Get every user"""
+
+    @abstractmethod
+    async def emails(self, user_ids: Iterable[str]) -> List[str]:
+        """Get the emails of the given users in one query"""
+
+    @abstractmethod
+    async def add_completed_count(self, user_ids: Iterable[str], delta: int) -> None:
+        """Atomically add delta to each user's completed_count"""
+
+    @abstractmethod
+    async def replace_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        """Set a new password hash if the current one is still old_hash"""
+
+
+class ProjectRepository(ABC):
+    @abstractmethod
+    async def get(self, project_id: str, projection: Optional[dict] = None) -> Optional[dict]:
+        """Get a project by ID; None for unknown or malformed IDs"""
+
+    @abstractmethod
+    async def get_many(self, project_ids: Iterable[str], projection: Optional[dict] = None) -> List[dict]:
+        """Get the projects with the given IDs in one query, in any order"""
+
+    @abstractmethod
+    async def create(self, project: dict) -> dict:
+        """Insert a project and return it with its "_id" set"""
+
+    @abstractmethod
+    async def create_many(self, projects: List[dict]) -> Dict[int, str]:
+        """Insert projects in one unordered batch, setting each "_id".
+
+        Returns the error message of each project the server rejected, by
+        index; every other project was inserted.
+        """
+
+    @abstractmethod
+    async def update(self, project_id: str, fields: dict, owner_id: Optional[str] = None) -> Optional[dict]:
+        """Set fields on a project (owned by owner_id, if given) and return it"""
+
+    @abstractmethod
+    async def delete(self, project_id: str, owner_id: Optional[str] = None) -> bool:
+        """Delete a project (owned by owner_id, if given)"""
+
+    @abstractmethod
+    async def add_completion_count(self, project_ids: Iterable[str], delta: int) -> int:
+        """Atomically add delta to each project's completion_count; returns how many exist"""
+
+    @abstractmethod
+    async def list(
+        self,
+        filters: ProjectQuery,
+        projection: Optional[dict] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """Get the filtered projects in the requested sort order"""
+
+    @abstractmethod
+    async def page(
+        self,
+        filters: ProjectQuery,
+        limit: int,
+        cursor: Optional[str] = None,
+        projection: Optional[dict] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Get one keyset page of filtered projects and the next page cursor"""
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        """Iterate over every project ordered by ID"""
+
+    @abstractmethod
+    async def search(
+        self,
+        query: Optional[str] = None,
+        tech_stack: Optional[List[str]] = None,
+        match_all: bool = False,
+        budget_min: Optional[int] = None,
+        budget_max: Optional[int] = None,
+        limit: int = 20,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        """Keyword / tech stack / budget search, best matches first"""
+
+    def watch(self, resume_after: Optional[dict] = None):
+        """Change stream of project inserts, edits and deletes, or None when
+        the backend has none (writers then publish changes themselves)"""
+        return None
+
+
+class CompletionRepository(ABC):
+    @abstractmethod
+    async def completed_ids(self, user_id: str, project_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """Get the IDs of projects the user completed, optionally within project_ids"""
+
+    @abstractmethod
+    async def add(self, user_id: str, project_id: str, completed_at: datetime) -> bool:
+        """Record a completion in one atomic upsert; False if it already existed"""
+
+    @abstractmethod
+    async def remove(self, user_id: str, project_id: str) -> bool:
+        """Delete one completion"""
+
+    @abstractmethod
+    async def add_many(self, user_id: str, project_ids: List[str], completed_at: datetime) -> Set[str]:
+        """Record completions in one unordered batch; returns the IDs already completed"""
+
+    @abstractmethod
+    async def list(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        direction: int = -1,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Get a user's completions ordered by completed_at, keyset paged when limit is set"""
+
+    @abstractmethod
+    async def user_ids_for_project(self, project_id: str) -> List[str]:
+        """Get the users who completed a project"""
+
+    @abstractmethod
+    async def delete_for_project(self, project_id: str) -> List[str]:
+        """Delete every completion of a project and return the users who had one"""
+
+
+# --------------------------------------------------
+# Motor Implementations
+# --------------------------------------------------
+class MotorUserRepository(UserRepository):
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def get(self, user_id: str) -> Optional[dict]:
+        oid = _object_id(user_id)
+        if oid is None:
+            return None
+        return await self.collection.find_one({"_id": oid})
+
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        return await self.collection.find_one({"email": email})
+
+    async def create(self, user: dict) -> str:
+        result = await self.collection.insert_one(user)
+        return str(result.inserted_id)
+
+    async def list_all(self) -> List[dict]:
+        return await self.collection.find({}).to_list(length=None)
+
+    async def emails(self, user_ids: Iterable[str]) -> List[str]:
+        oids = [ObjectId(i) for i in user_ids if ObjectId.is_valid(i)]
+        if not oids:
+            return []
+        return [
+            user["email"]
+            async for user in self.collection.find({"_id": {"$in": oids}}, {"_id": 0, "email": 1})
+        ]
+
+    async def add_completed_count(self, user_ids: Iterable[str], delta: int) -> None:
+        oids = [ObjectId(i) for i in user_ids if ObjectId.is_valid(i)]
+        if oids:
+            await self.collection.update_many(
+                {"_id": {"$in": oids}}, {"$inc": {"completed_count": delta}}
+            )
+
+    async def replace_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        oid = _object_id(user_id)
+        if oid is None:
+            return False
+        result = await self.collection.update_one(
+            {"_id": oid, "password_hash": old_hash},
+            {"$set": {"password_hash": new_hash}},
+        )
+        return result.modified_count == 1
+
+
+class MotorProjectRepository(ProjectRepository):
+    def __init__(self, collection):
+        self.collection = collection
+
+    @staticmethod
+    def _owned(oid: ObjectId, owner_id: Optional[str]) -> dict:
+        query = {"_id": oid}
+        if owner_id:
+            query["created_by"] = owner_id
+        return query
+
+    async def get(self, project_id: str, projection: Optional[dict] = None) -> Optional[dict]:
+        oid = _object_id(project_id)
+        if oid is None:
+            return None
+        return await self.collection.find_one({"_id": oid}, projection)
+
+    async def get_many(self, project_ids: Iterable[str], projection: Optional[dict] = None) -> List[dict]:
+        oids = [ObjectId(i) for i in project_ids if ObjectId.is_valid(i)]
+        if not oids:
+            return []
+        return await self.collection.find({"_id": {"$in": oids}}, projection).to_list(length=None)
+
+    async def create(self, project: dict) -> dict:
+        await self.collection.insert_one(project)
+        project_search.on_upsert(project)
+        return project
+
+    async def create_many(self, projects: List[dict]) -> Dict[int, str]:
+        if not projects:
+            return {}
+        failures = {}
+        try:
+            await self.collection.insert_many(projects, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: the other documents were still inserted
+            failures = {
+                error["index"]: error.get("errmsg", "Write failed")
+                for error in e.details.get("writeErrors", [])
+            }
+            if not failures:
+                raise
+        for index, project in enumerate(projects):
+            if index not in failures:
+                project_search.on_upsert(project)
+        return failures
+
+    async def update(self, project_id: str, fields: dict, owner_id: Optional[str] = None) -> Optional[dict]:
+        oid = _object_id(project_id)
+        if oid is None:
+            return None
+        project = await self.collection.find_one_and_update(
+            self._owned(oid, owner_id),
+            {"$set": fields},
+            return_document=ReturnDocument.AFTER,
+        )
+        if project:
+            project_search.on_upsert(project)
+        return project
+
+    async def delete(self, project_id: str, owner_id: Optional[str] = None) -> bool:
+        oid = _object_id(project_id)
+        if oid is None:
+            return False
+        result = await self.collection.delete_one(self._owned(oid, owner_id))
+        if result.deleted_count:
+            project_search.on_delete(project_id)
+        return result.deleted_count > 0
+
+    async def add_completion_count(self, project_ids: Iterable[str], delta: int) -> int:
+        oids = [ObjectId(i) for i in project_ids if ObjectId.is_valid(i)]
+        if not oids:
+            return 0
+        result = await self.collection.update_many(
+            {"_id": {"$in": oids}}, {"$inc": {"completion_count": delta}}
+        )
+        return result.matched_count
+
+    async def list(
+        self,
+        filters: ProjectQuery,
+        projection: Optional[dict] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        cursor = self.collection.find(filters.to_mongo(), projection).sort(filters.sort_spec())
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=None)
+
+    async def page(
+        self,
+        filters: ProjectQuery,
+        limit: int,
+        cursor: Optional[str] = None,
+        projection: Optional[dict] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        return await fetch_keyset_page(
+            self.collection,
+            filters.to_mongo(),
+            limit,
+            cursor,
+            sort_field=filters.sort_field,
+            direction=filters.direction,
+            projection=projection,
+        )
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        async for project in self.collection.find().sort("_id", 1).batch_size(batch_size):
+            yield project
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        tech_stack: Optional[List[str]] = None,
+        match_all: bool = False,
+        budget_min: Optional[int] = None,
+        budget_max: Optional[int] = None,
+        limit: int = 20,
+        projection: Optional[dict] = None,
+    ) -> List[dict]:
+        return await project_search.search(
+            self.collection,
+            query=query,
+            tech_stack=tech_stack,
+            match_all=match_all,
+            budget_min=budget_min,
+            budget_max=budget_max,
+            limit=limit,
+            projection=projection,
+        )
+
+    # Counter-only updates (completion_count) are not project edits
+    WATCH_PIPELINE = [{"$match": {"$or": [
+        {"operationType": {"$in": ["insert", "replace", "delete"]}},
+        {
+            "operationType": "update",
+            "updateDescription.updatedFields.completion_count": {"$exists": False},
+        },
+    ]}}]
+
+    def watch(self, resume_after: Optional[dict] = None):
+        return self.collection.watch(
+            self.WATCH_PIPELINE,
+            full_document="updateLookup",
+            resume_after=resume_after,
+        )
+
+
+class MotorCompletionRepository(CompletionRepository):
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def completed_ids(self, user_id: str, project_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        query = {"user_id": user_id}
+        if project_ids is not None:
+            query["project_id"] = {"$in": list(project_ids)}
+
+        completed = set()
+        async for completion in self.collection.find(query, {"_id": 0, "project_id": 1}):
+            completed.add(completion["project_id"])
+        return completed
+
+    async def add(self, user_id: str, project_id: str, completed_at: datetime) -> bool:
+        try:
+            result = await self.collection.update_one(
+                {"user_id": user_id, "project_id": project_id},
+                {"$setOnInsert": {"completed_at": completed_at}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert of the same pair won the unique index
+            return False
+        return result.upserted_id is not None
+
+    async def remove(self, user_id: str, project_id: str) -> bool:
+        result = await self.collection.delete_one(
+            {"user_id": user_id, "project_id": project_id}
+        )
+        return result.deleted_count > 0
+
+    async def add_many(self, user_id: str, project_ids: List[str], completed_at: datetime) -> Set[str]:
+        if not project_ids:
+            return set()
+        docs = [
+            {"user_id": user_id, "project_id": project_id, "completed_at": completed_at}
+            for project_id in project_ids
+        ]
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # The unique (user_id, project_id) index rejects duplicates one
+            # by one; anything else is a real failure
+            errors = e.details.get("writeErrors", [])
+            if any(error["code"] != 11000 for error in errors):
+                raise
+            return {docs[error["index"]]["project_id"] for error in errors}
+        return set()
+
+    async def list(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        direction: int = -1,
+    ) -> Tuple[List[dict], Optional[str]]:
+        query = {"user_id": user_id}
+        if limit:
+            return await fetch_keyset_page(
+                self.collection, query, limit, cursor,
+                sort_field="completed_at", direction=direction,
+            )
+
+        completions = await self.collection.find(query).sort(
+            [("completed_at", direction), ("_id", direction)]
+        ).to_list(length=None)
+        return completions, None
+
+    async def user_ids_for_project(self, project_id: str) -> List[str]:
+        return await self.collection.distinct("user_id", {"project_id": project_id})
+
+    async def delete_for_project(self, project_id: str) -> List[str]:
+        # Only delete the completions that were read, so every user whose
+        # counter is decremented really lost one
+        user_ids = await self.collection.distinct("user_id", {"project_id": project_id})
+        if user_ids:
+            await self.collection.delete_many(
+                {"project_id": project_id, "user_id": {"$in": user_ids}}
+            )
+        return user_ids
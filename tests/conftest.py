@@ -0,0 +1,82 @@
+import os
+
+# Offline settings, read once when the app is first imported
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+os.environ.setdefault("PROJECT_FEED_SOURCE", "local")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from backend.app.core.response_cache import project_response_cache
+from backend.app.core.tasks import task_queue
+from backend.app.main import app
+from backend.app.services.completion_cache import completion_cache
+from database.connection import set_database
+from database.memory import InMemoryDatabase
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _Yielding:
+    """Repository proxy that gives up control around every call, like a
+    round trip to Mongo does, so concurrent requests really interleave"""
+
+    def __init__(self, repository):
+        self._repository = repository
+
+    def __getattr__(self, name):
+        attr = getattr(self._repository, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            await asyncio.sleep(0)
+            result = await attr(*args, **kwargs)
+            await asyncio.sleep(0)
+            return result
+        return call
+
+
+@pytest.fixture
+async def db():
+    database = InMemoryDatabase()
+    for name in ("users", "projects", "completions"):
+        setattr(database, name, _Yielding(getattr(database, name)))
+    set_database(database)
+    completion_cache.clear()
+    project_response_cache.invalidate()
+    yield database
+    # Workers are bound to this test's event loop
+    await task_queue.drain()
+
+
+@pytest.fixture
+async def client(db):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def signup(client: httpx.AsyncClient, email: str) -> dict:
+    """Create a user and return bearer auth headers for it"""
+    response = await client.post(
+        "/auth/signup", json={"name": email.split("@")[0], "email": email, "password": "secret1"}
+    )
+    assert response.status_code == 200, response.text
+    client.cookies.clear()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def create_project(client: httpx.AsyncClient, headers: dict, **fields) -> str:
+    project = {"title": "Project", "description": "Description", "budget": 100, "tech_stack": ["python"]}
+    project.update(fields)
+    response = await client.post("/projects", json=project, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
@@ -0,0 +1,23 @@
+import pytest
+
+from backend.app.core import dependencies
+from backend.app.core.jwt_utils import decode_token
+from conftest import signup
+
+pytestmark = pytest.mark.anyio
+
+
+def user_id(headers: dict) -> str:
+    return decode_token(headers["Authorization"].split(" ")[1])["id"]
+
+
+async def test_admin_access_is_granted_by_user_id(client, monkeypatch):
+    admin = await signup(client, "admin@corp.com")
+    lookalike = await signup(client, "ADMIN@corp.com")
+    monkeypatch.setattr(dependencies.settings, "ADMIN_USER_IDS", {user_id(admin)})
+
+    assert (await client.get("/admin/profiler", headers=admin)).status_code == 200
+    for path in ("/admin/profiler", "/admin/profiler/stacks"):
+        assert (await client.get(path, headers=lookalike)).status_code == 403
+    response = await client.post("/admin/profiler", json={"enabled": False}, headers=lookalike)
+    assert response.status_code == 403
@@ -0,0 +1,74 @@
+import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from backend.app.schemas.schemas import BULK_MAX_ITEMS
+from conftest import signup
+from database.repositories import MotorProjectRepository
+
+pytestmark = pytest.mark.anyio
+
+PROJECT = {"title": "Project", "description": "Description", "budget": 100, "tech_stack": ["python"]}
+
+
+class _RejectingCollection:
+    """insert_many stand-in that rejects the documents at ``rejected``"""
+
+    def __init__(self, rejected):
+        self.rejected = rejected
+        self.inserted = []
+
+    async def insert_many(self, documents, ordered=True):
+        errors = []
+        for index, document in enumerate(documents):
+            document.setdefault("_id", ObjectId())
+            if index in self.rejected:
+                errors.append({"index": index, "code": 121, "errmsg": "Document failed validation"})
+            else:
+                self.inserted.append(document)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(self.inserted)})
+
+
+async def test_oversized_batch_is_rejected_while_parsing(client):
+    headers = await signup(client, "owner@example.com")
+
+    response = await client.post(
+        "/projects/bulk", json={"projects": [PROJECT] * (BULK_MAX_ITEMS + 1)}, headers=headers
+    )
+    assert response.status_code == 422
+
+    response = await client.post(
+        "/projects/complete/bulk", json={"project_ids": ["x"] * (BULK_MAX_ITEMS + 1)}, headers=headers
+    )
+    assert response.status_code == 422
+
+
+async def test_bulk_create_reports_rejected_rows(client, db, monkeypatch):
+    headers = await signup(client, "owner@example.com")
+
+    async def create_many(projects):
+        for project in projects:
+            await db.projects.create(project)
+        return {1: "Document failed validation"}
+
+    monkeypatch.setattr(db.projects, "create_many", create_many)
+    response = await client.post(
+        "/projects/bulk", json={"projects": [PROJECT, {"title": ""}, PROJECT, PROJECT]}, headers=headers
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["invalid"], body["failed"]) == (2, 1, 1)
+    assert [r["status"] for r in body["results"]] == ["created", "invalid", "failed", "created"]
+    assert body["results"][2]["errors"] == [{"loc": [], "msg": "Document failed validation"}]
+
+
+async def test_motor_create_many_maps_write_errors_to_indexes():
+    collection = _RejectingCollection(rejected={0, 2})
+    projects = [dict(PROJECT) for _ in range(3)]
+
+    failures = await MotorProjectRepository(collection).create_many(projects)
+
+    assert failures == {0: "Document failed validation", 2: "Document failed validation"}
+    assert collection.inserted == [projects[1]]
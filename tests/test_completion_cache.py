@@ -0,0 +1,24 @@
+import pytest
+from bson import ObjectId
+
+from backend.app.services.completion_cache import CompletionCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def _load(user_id):
+    return set()
+
+
+async def test_writes_do_not_count_as_hits_or_misses():
+    cache = CompletionCache(maxsize=10, ttl=60)
+    project_id = str(ObjectId())
+    await cache.get("user", _load)
+
+    cache.added("user", project_id)
+    cache.removed(["user", "other"], project_id)
+    cache.added("user", project_id)
+
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+    assert project_id in await cache.get("user", _load)
+    assert cache.stats()["hits"] == 1
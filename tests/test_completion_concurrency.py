@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from conftest import create_project, signup
+
+pytestmark = pytest.mark.anyio
+
+MISSING_ID = "6ad51e01efa8d84a4be81b0a"
+
+
+async def test_concurrent_completes_record_one_completion(client):
+    owner = await signup(client, "owner@example.com")
+    project_id = await create_project(client, owner)
+
+    responses = await asyncio.gather(*[
+        client.patch(f"/projects/{project_id}/complete", headers=owner) for _ in range(10)
+    ])
+
+    assert all(r.status_code == 200 for r in responses)
+    messages = [r.json()["message"] for r in responses]
+    assert messages.count("Project marked as completed") == 1
+    assert messages.count("Already completed") == 9
+
+    project = (await client.get(f"/projects/{project_id}", headers=owner)).json()
+    assert project["completion_count"] == 1
+    assert project["isCompleted"] is True
+
+
+async def test_complete_missing_project_is_404(client):
+    owner = await signup(client, "owner@example.com")
+
+    response = await client.patch(f"/projects/{MISSING_ID}/complete", headers=owner)
+
+    assert response.status_code == 404
+    completed = await client.get("/projects/completed/me", headers=owner)
+    assert completed.json() == []
+
+
+async def test_concurrent_deletes_succeed_once(client):
+    owner = await signup(client, "owner@example.com")
+    project_id = await create_project(client, owner)
+
+    responses = await asyncio.gather(*[
+        client.delete(f"/projects/{project_id}", headers=owner) for _ in range(5)
+    ])
+
+    assert sorted(r.status_code for r in responses) == [200, 404, 404, 404, 404]
+
+
+async def test_concurrent_edits_all_apply(client):
+    owner = await signup(client, "owner@example.com")
+    project_id = await create_project(client, owner)
+
+    responses = await asyncio.gather(*[
+        client.put(f"/projects/{project_id}", json={"title": f"Title {i}"}, headers=owner)
+        for i in range(5)
+    ])
+
+    assert all(r.status_code == 200 for r in responses)
+
+
+async def test_foreign_edit_and_delete_are_forbidden(client):
+    owner = await signup(client, "owner@example.com")
+    other = await signup(client, "other@example.com")
+    project_id = await create_project(client, owner)
+
+    edit = await client.put(f"/projects/{project_id}", json={"title": "Taken"}, headers=other)
+    empty_edit = await client.put(f"/projects/{project_id}", json={}, headers=other)
+    delete = await client.delete(f"/projects/{project_id}", headers=other)
+
+    assert (edit.status_code, empty_edit.status_code, delete.status_code) == (403, 403, 403)
+    project = (await client.get(f"/projects/{project_id}", headers=owner)).json()
+    assert project["title"] == "Project"
+
+
+async def test_edit_or_delete_missing_project_is_404(client):
+    owner = await signup(client, "owner@example.com")
+
+    edit = await client.put(f"/projects/{MISSING_ID}", json={"title": "x"}, headers=owner)
+    delete = await client.delete(f"/projects/{MISSING_ID}", headers=owner)
+
+    assert (edit.status_code, delete.status_code) == (404, 404)
+
+
+async def test_concurrent_completes_of_missing_project_are_all_404(client):
+    owner = await signup(client, "owner@example.com")
+
+    responses = await asyncio.gather(*[
+        client.patch(f"/projects/{MISSING_ID}/complete", headers=owner) for _ in range(5)
+    ])
+
+    assert [r.status_code for r in responses] == [404] * 5
@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from backend.app.core.tasks import task_queue
+from backend.app.services.email_service import EmailService, email_service
+from conftest import create_project, signup
+
+pytestmark = pytest.mark.anyio
+
+RESET_URL = "http://test/reset-password?token=s3cr3t-token"
+
+
+async def test_unconfigured_email_logs_recipient_not_body(caplog):
+    service = EmailService(None, batch_wait_ms=0)
+    caplog.set_level(logging.INFO, logger="backend.app.services.email_service")
+
+    assert service.send_template(["user@example.com"], "password_reset",
+                                 reset_url=RESET_URL, expires_hours=24) == 1
+    await service.drain()
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "user@example.com" in warnings[0].getMessage()
+    assert "s3cr3t-token" not in caplog.text
+
+
+async def test_project_edit_notifies_users_who_completed_it(client, monkeypatch):
+    sent = []
+    monkeypatch.setattr(email_service, "send_template",
+                        lambda recipients, template, **context: sent.append((list(recipients), context)) or 0)
+    owner = await signup(client, "owner@example.com")
+    project_id = await create_project(client, owner)
+    for email in ("a@example.com", "b@example.com"):
+        headers = await signup(client, email)
+        await client.patch(f"/projects/{project_id}/complete", headers=headers)
+    await client.patch(f"/projects/{project_id}/complete", headers=owner)
+
+    response = await client.put(f"/projects/{project_id}", json={"budget": 250}, headers=owner)
+    assert response.status_code == 200
+    await task_queue.drain()
+
+    assert len(sent) == 1
+    recipients, context = sent[0]
+    assert sorted(recipients) == ["a@example.com", "b@example.com"]
+    assert context["summary"] == "budget changed"
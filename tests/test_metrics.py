@@ -0,0 +1,17 @@
+import pytest
+
+from conftest import create_project, signup
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metrics_reports_cache_stats(client):
+    owner = await signup(client, "owner@example.com")
+    project_id = await create_project(client, owner)
+    await client.get("/projects")
+    await client.get(f"/projects/{project_id}", headers=owner)
+
+    text = (await client.get("/metrics")).text
+
+    for gauge in ("user_cache", "completion_cache", "response_cache", "bcrypt", "task_queue"):
+        assert f'{gauge}{{stat="' in text
@@ -0,0 +1,18 @@
+import asyncio
+
+from backend.app.core import jwt_utils
+
+
+def test_password_pool_survives_a_new_event_loop(monkeypatch):
+    # One slot forces callers to wait on the semaphore in both loops
+    monkeypatch.setattr(jwt_utils.settings, "BCRYPT_POOL_SIZE", 1)
+    jwt_utils.shutdown_password_pool()
+
+    async def hash_many():
+        return await asyncio.gather(*[jwt_utils.hash_password_async("secret1") for _ in range(6)])
+
+    try:
+        for _ in range(2):
+            assert len(asyncio.run(hash_many())) == 6
+    finally:
+        jwt_utils.shutdown_password_pool()
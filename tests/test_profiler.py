@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.profiler import ProfilerMiddleware, SamplingProfiler
+
+pytestmark = pytest.mark.anyio
+
+SCOPE = {"type": "http", "method": "GET", "path": "/"}
+
+
+class _Route:
+    path = "/slow"
+
+
+async def _receive():
+    return {"type": "http.disconnect"}
+
+
+async def _send(message):
+    pass
+
+
+async def test_samples_show_up_while_the_request_runs():
+    profiler = SamplingProfiler(enabled=True, sample_rate=1, interval_ms=1)
+    seen = {}
+
+    async def app(scope, receive, send):
+        scope["route"] = _Route()
+        for _ in range(200):
+            await asyncio.sleep(0.005)
+            if profiler.status()["routes"].get("/slow"):
+                break
+        seen.update(profiler.status())
+
+    await ProfilerMiddleware(app, profiler)(dict(SCOPE), _receive, _send)
+
+    assert seen["in_flight"] == 1
+    assert seen["routes"]["/slow"] > 0
+    assert profiler.status()["sampled_requests"] == 1
+
+
+async def test_event_streams_stop_being_sampled_once_started():
+    profiler = SamplingProfiler(enabled=True, sample_rate=1, interval_ms=1)
+    in_flight = []
+
+    async def app(scope, receive, send):
+        in_flight.append(profiler.status()["in_flight"])
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream; charset=utf-8")],
+        })
+        in_flight.append(profiler.status()["in_flight"])
+        await send({"type": "http.response.body", "body": b""})
+
+    await ProfilerMiddleware(app, profiler)(dict(SCOPE), _receive, _send)
+
+    assert in_flight == [1, 0]
+    assert profiler.status()["sampled_requests"] == 1
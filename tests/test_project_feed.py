@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+
+from backend.app.services.project_feed import ProjectFeed
+
+pytestmark = pytest.mark.anyio
+
+
+class _Stream:
+    """Change stream stand-in: try_next / iteration either fail or idle"""
+
+    def __init__(self, error=None):
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def try_next(self):
+        if self.error is not None:
+            raise self.error
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.Event().wait()
+
+
+class _Projects:
+    """Projects repository whose first ``watch()`` calls fail with ``errors``"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.watches = 0
+
+    def watch(self, resume_after=None):
+        self.watches += 1
+        return _Stream(self.errors.pop(0) if self.errors else None)
+
+
+class _NoChangeStreams:
+    def watch(self, resume_after=None):
+        return None
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: sleep(0))
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+async def test_unreachable_database_does_not_block_start(no_backoff):
+    feed = ProjectFeed(source="auto")
+    projects = _Projects(ServerSelectionTimeoutError("no servers"), ServerSelectionTimeoutError("no servers"))
+
+    await asyncio.wait_for(feed.start(projects), 1)
+    assert feed.stats()["change_stream"] == 0
+
+    # Published in-process until the stream opens
+    feed.publish("deleted", str(ObjectId()))
+    assert feed.published == 1
+
+    await _settle()
+    assert projects.watches == 3
+    assert feed.stats()["change_stream"] == 1
+    feed.publish("deleted", str(ObjectId()))
+    assert feed.published == 1
+    await feed.close()
+
+
+async def test_unsupported_deployment_falls_back_to_local():
+    feed = ProjectFeed(source="auto")
+
+    await feed.start(_Projects(OperationFailure("only supported on replica sets", 40573)))
+    await _settle()
+
+    assert feed.source == "local"
+    assert feed.stats()["change_stream"] == 0
+    feed.publish("deleted", str(ObjectId()))
+    assert feed.published == 1
+    await feed.close()
+
+
+async def test_backend_without_change_streams_falls_back_to_local():
+    feed = ProjectFeed(source="auto")
+
+    await feed.start(_NoChangeStreams())
+    await _settle()
+
+    assert feed.source == "local"
+    await feed.close()
+
+
+async def test_forced_change_stream_keeps_retrying(no_backoff):
+    feed = ProjectFeed(source="change_stream")
+    projects = _Projects(OperationFailure("only supported on replica sets", 40573))
+
+    await feed.start(projects)
+    await _settle()
+
+    assert feed.source == "change_stream"
+    assert projects.watches == 2
+    assert feed.stats()["change_stream"] == 1
+    await feed.close()
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import pytest
+
+from backend.app.services.project_query import ProjectQuery
+from conftest import create_project, signup
+
+pytestmark = pytest.mark.anyio
+
+
+def test_aware_created_filters_become_naive_utc():
+    query = ProjectQuery(created_after="2020-01-01T02:00:00+02:00", created_before="2030-01-01T00:00:00Z")
+
+    assert query.created_after == datetime(2020, 1, 1)
+    assert query.created_before == datetime(2030, 1, 1)
+
+
+async def test_created_filters_accept_timezones(client):
+    owner = await signup(client, "owner@example.com")
+    await create_project(client, owner)
+
+    response = await client.get("/projects", params={"created_after": "2020-01-01T00:00:00Z"})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    response = await client.get("/projects", params={"created_before": "2020-01-01T00:00:00+00:00"})
+    assert response.status_code == 200
+    assert response.json() == []
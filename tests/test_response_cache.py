@@ -0,0 +1,27 @@
+import pytest
+
+from backend.app.core.tasks import task_queue
+from conftest import create_project, signup
+
+pytestmark = pytest.mark.anyio
+
+
+async def anonymous_count(client, project_id: str) -> int:
+    response = await client.get(f"/projects/{project_id}")
+    assert response.status_code == 200
+    return response.json()["completion_count"]
+
+
+async def test_completion_refreshes_cached_anonymous_responses(client):
+    owner = await signup(client, "owner@example.com")
+    first = await create_project(client, owner)
+    second = await create_project(client, owner)
+    assert await anonymous_count(client, first) == 0
+    assert await anonymous_count(client, second) == 0
+
+    await client.patch(f"/projects/{first}/complete", headers=owner)
+    assert await anonymous_count(client, first) == 1
+
+    await client.post("/projects/complete/bulk", json={"project_ids": [second]}, headers=owner)
+    await task_queue.drain()
+    assert await anonymous_count(client, second) == 1
@@ -0,0 +1,67 @@
+import pytest
+from pymongo.errors import ExecutionTimeout, OperationFailure
+
+from backend.app.services.search import ProjectSearch
+
+pytestmark = pytest.mark.anyio
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Collection:
+    def find(self, *args, **kwargs):
+        return _Cursor([])
+
+
+def failing_search(error):
+    async def search_mongo(*args):
+        raise error
+    return search_mongo
+
+
+@pytest.mark.parametrize("error", [
+    OperationFailure("operation exceeded time limit", 50),
+    ExecutionTimeout("operation exceeded time limit", 50),
+    OperationFailure("interrupted", 11601),
+])
+async def test_transient_errors_do_not_switch_to_the_fallback(monkeypatch, error):
+    search = ProjectSearch("auto")
+    monkeypatch.setattr(search, "_search_mongo", failing_search(error))
+
+    with pytest.raises(OperationFailure):
+        await search.search(_Collection(), query="react")
+    assert not search.uses_fallback
+
+
+@pytest.mark.parametrize("error", [
+    OperationFailure("text index required for $text query", 27),
+    NotImplementedError("The $text operator is not implemented"),
+])
+async def test_missing_text_support_switches_to_the_fallback(monkeypatch, error):
+    search = ProjectSearch("auto")
+    monkeypatch.setattr(search, "_search_mongo", failing_search(error))
+
+    assert await search.search(_Collection(), query="react") == []
+    assert search.uses_fallback
+
+
+async def test_mongo_backend_never_falls_back(monkeypatch):
+    search = ProjectSearch("mongo")
+    monkeypatch.setattr(search, "_search_mongo", failing_search(
+        OperationFailure("text index required for $text query", 27)
+    ))
+
+    with pytest.raises(OperationFailure):
+        await search.search(_Collection(), query="react")
@@ -0,0 +1,49 @@
+import pytest
+from pymongo.errors import AutoReconnect, ServerSelectionTimeoutError
+
+from backend.app.core.tasks import TaskQueue
+from backend.app.services.services import _not_sent
+
+pytestmark = pytest.mark.anyio
+
+
+def failing_job(*errors):
+    calls = []
+
+    async def job():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+    return job, calls
+
+
+async def test_counter_job_is_not_retried_after_it_may_have_applied():
+    queue = TaskQueue(retry_delay=0)
+    job, calls = failing_job(AutoReconnect("connection closed"))
+
+    queue.enqueue("counter", job, retry_if=_not_sent)
+    await queue.drain()
+
+    assert len(calls) == 1
+    assert (queue.retried, queue.failed) == (0, 1)
+
+
+async def test_counter_job_is_retried_when_the_update_was_never_sent():
+    queue = TaskQueue(retry_delay=0)
+    job, calls = failing_job(ServerSelectionTimeoutError("no servers"))
+
+    queue.enqueue("counter", job, retry_if=_not_sent)
+    await queue.drain()
+
+    assert len(calls) == 2
+    assert (queue.retried, queue.completed) == (1, 1)
+
+
+async def test_jobs_without_retry_if_retry_any_error():
+    queue = TaskQueue(retry_delay=0)
+    job, calls = failing_job(AutoReconnect("connection closed"))
+
+    queue.enqueue("cascade", job)
+    await queue.drain()
+
+    assert len(calls) == 2